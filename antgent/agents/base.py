@@ -1,17 +1,23 @@
+import asyncio
 import logging
 from abc import abstractmethod
 from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from functools import cache
+from typing import Any, TypeVar
 
 from agents import (
     Agent,
+    AgentOutputSchema,
+    AgentOutputSchemaBase,
     Model,
     OpenAIChatCompletionsModel,
     OpenAIResponsesModel,
     RunContextWrapper,
 )
-from agents.extensions.models.litellm_model import LitellmModel
+from pydantic import BaseModel
+from pydantic_core import from_json
 
+from antgent.agents.batch import BatchMixin
 from antgent.agents.config_resolver import ConfigResolverMixin
 from antgent.agents.message_handler import MessageHandlerMixin
 from antgent.agents.runner import AgentRunnerMixin
@@ -35,7 +41,36 @@ MaybeAwaitable = Awaitable[T] | T  # type: ignore[valid-type]
 __all__ = ["BaseAgent", "PrepareRun", "TLLMInput"]
 
 
-class BaseAgent[TContext, TOutput](ConfigResolverMixin, MessageHandlerMixin, AgentRunnerMixin[TContext, TOutput]):
+class TrustedOutputSchema(AgentOutputSchema):
+    """
+    Builds the output with model_construct, skipping pydantic validation.
+    Only for flat models (nested models would stay dicts) whose schema is enforced by the provider.
+    """
+
+    def validate_json(self, json_str: str) -> Any:
+        data = from_json(json_str) if json_str else None
+        if not isinstance(data, dict):
+            return super().validate_json(json_str)
+        return self.output_type.model_construct(**data)
+
+
+@cache
+def output_schema(output_cls: type, trusted: bool = False) -> AgentOutputSchemaBase:
+    """
+    Output schema (JSON schema + validator) for a structured output class, built once per class.
+    Passing a plain type to Agent makes the SDK rebuild the TypeAdapter and schema on every run.
+    """
+    if trusted and issubclass(output_cls, BaseModel):
+        return TrustedOutputSchema(output_cls)
+    return AgentOutputSchema(output_cls)
+
+
+class BaseAgent[TContext, TOutput](
+    ConfigResolverMixin,
+    MessageHandlerMixin,
+    AgentRunnerMixin[TContext, TOutput],
+    BatchMixin[TContext, TOutput],
+):
     name_id: str = "Base"
     default_config: AgentConfig
     agent_config: AgentFrozenConfig[TOutput, TOutput]
@@ -54,6 +89,7 @@ class BaseAgent[TContext, TOutput](ConfigResolverMixin, MessageHandlerMixin, Age
         self.alias_resolver = alias_resolver or Aliases
         self.conf = self.update_config(conf)
         self._max_tokens: int | None = None
+        self._agent: Agent[TContext] | None = None
 
     @abstractmethod
     def prompt(self) -> str | Callable[[RunContextWrapper[TContext], Agent[TContext]], MaybeAwaitable[str]] | None:
@@ -78,24 +114,35 @@ class BaseAgent[TContext, TOutput](ConfigResolverMixin, MessageHandlerMixin, Age
         cls.provider_config = provider_config
 
     def get_sdk_model(self) -> Model:
+        model_name = self.model
         logger.info(
             "[%s] Using model: %s (client=%s, api_mode=%s)",
             self.name_id,
-            self.model,
+            model_name,
             self.conf.client,
             self.conf.api_mode,
         )
-        if self.conf.api_mode == "response":
-            return OpenAIResponsesModel(
-                model=self.model, openai_client=openai_aclient(self.conf.client, llms=self.llms_conf)
-            )
-        if self.conf.client == "openai":
-            return OpenAIChatCompletionsModel(
-                model=self.model, openai_client=openai_aclient(self.conf.client, llms=self.llms_conf)
-            )
-        return LitellmModel(model=self.model, api_key=self.conf.api_key, base_url=self.conf.base_url)
+        if self.conf.api_mode == "response" or self.conf.client == "openai":
+            # openai_aclient is cached per (client, llms): the connection pool is shared across agents
+            model_cls = OpenAIResponsesModel if self.conf.api_mode == "response" else OpenAIChatCompletionsModel
+            return model_cls(model=model_name, openai_client=openai_aclient(self.conf.client, llms=self.llms_conf))
+        from agents.extensions.models.litellm_model import LitellmModel  # noqa: PLC0415
+
+        return LitellmModel(model=model_name, api_key=self.conf.api_key, base_url=self.conf.base_url)
 
     def agent(self) -> Agent[TContext]:
+        """Returns the SDK Agent, built once per instance and reused across runs."""
+        if self._agent is None:
+            self._agent = self._build_agent()
+        return self._agent
+
+    def _output_type(self) -> type | AgentOutputSchemaBase | None:
+        structured_cls = self.agent_config.get_structured_cls()
+        if structured_cls is None or structured_cls is str:
+            return structured_cls
+        return output_schema(structured_cls, trusted=self.agent_config.trusted_output)
+
+    def _build_agent(self) -> Agent[TContext]:
         model = self.get_sdk_model()
         logger.debug("Agent: %s", self.conf.name)
         logger.debug("Model: %s", self.model)
@@ -103,11 +150,32 @@ class BaseAgent[TContext, TOutput](ConfigResolverMixin, MessageHandlerMixin, Age
         logger.debug("Model settings: %s", self.conf.model_settings)
         return Agent(
             name=self.conf.name,
-            model=self.get_sdk_model(),
+            model=model,
             instructions=self.prompt(),
-            output_type=self.agent_config.get_structured_cls(),
+            output_type=self._output_type(),
             model_settings=self.conf.model_settings,
         )
 
     async def workflow(self, llm_input: TLLMInput, context: TContext) -> TOutput | None:
         return await self.run(self.agent(), llm_input, context)
+
+    async def workflow_batch(
+        self,
+        contexts: list[TContext],
+        llm_input: TLLMInput = "",
+        *,
+        max_concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> list[TOutput | BaseException | None]:
+        """
+        Runs the workflow over several contexts concurrently, at most max_concurrency in flight.
+        Results are returned in the order of contexts; with return_exceptions, failures are returned
+        in place instead of raised.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(context: TContext) -> TOutput | None:
+            async with sem:
+                return await self.workflow(llm_input, context)
+
+        return await asyncio.gather(*[_one(ctx) for ctx in contexts], return_exceptions=return_exceptions)
@@ -1,7 +1,7 @@
 import logging
 from typing import TYPE_CHECKING, Any
 
-from antgent.models.agent import AgentConfig, ModelProvidersConfig, ProviderMapping
+from antgent.models.agent import AgentConfig, ModelProvidersConfig, ProviderMapping, ProviderSettings
 
 if TYPE_CHECKING:
     from antgent.agents.base import BaseAgent
@@ -22,19 +22,6 @@ class ConfigResolverMixin:
             logger.info("[%s] Alias resolved: %s -> %s", self.name_id, model_name, resolved)
         return resolved
 
-    @classmethod
-    def _find_provider_mapping(
-        cls: type["BaseAgent"], model_name: str, provider_config: ModelProvidersConfig
-    ) -> ProviderMapping | None:
-        """Finds matching provider mapping for the given model name."""
-        for mapping in provider_config.mappings:
-            if model_name.startswith(mapping.prefix):
-                logger.debug("[%s] Matched prefix '%s' for model '%s'", cls.name_id, mapping.prefix, model_name)
-                return mapping
-
-        logger.debug("[%s] No prefix match found for '%s', using default provider settings", cls.name_id, model_name)
-        return None
-
     @classmethod
     def _apply_provider_setting(
         cls: type["BaseAgent"],
@@ -42,8 +29,7 @@ class ConfigResolverMixin:
         result_dict: dict[str, Any],
         config_overrides: dict[str, Any],
         *,
-        matched_mapping: ProviderMapping | None,
-        provider_config: ModelProvidersConfig,
+        settings: ProviderMapping | ProviderSettings,
     ):
         """Applies a single provider setting (client or api_mode) to result_dict."""
         if setting_name in config_overrides:
@@ -52,29 +38,38 @@ class ConfigResolverMixin:
             )
             return
 
-        if matched_mapping:
-            value = getattr(matched_mapping, setting_name)
-            result_dict[setting_name] = value
+        value = getattr(settings, setting_name)
+        result_dict[setting_name] = value
+        if isinstance(settings, ProviderMapping):
             logger.info("[%s] Applying %s from matched mapping: %s", cls.name_id, setting_name, value)
         else:
-            value = getattr(provider_config.default, setting_name)
-            result_dict[setting_name] = value
             logger.info("[%s] Applying default %s: %s", cls.name_id, setting_name, value)
 
+    @staticmethod
+    def _config_overrides(conf: AgentConfig) -> dict[str, Any]:
+        """Fields explicitly set on conf and different from their default (like exclude_unset + exclude_defaults)."""
+        fields = type(conf).model_fields
+        overrides: dict[str, Any] = {}
+        for name in conf.model_fields_set:
+            value = getattr(conf, name)
+            field = fields.get(name)
+            if field is not None and value == field.get_default(call_default_factory=True):
+                continue
+            overrides[name] = value
+        return overrides
+
     def update_config(self: "BaseAgent", conf: AgentConfig | dict[str, AgentConfig] | None = None) -> AgentConfig:
         if isinstance(conf, dict):
             conf = conf.get(self.name_id, None)
 
-        # Start with default config
-        result_dict = self.default_config.model_dump()
+        # Provider settings resolved below, applied on top of the default config
+        result_dict: dict[str, Any] = {}
 
         # Get overrides from provided config
-        config_overrides = {}
-        if conf:
-            config_overrides = conf.model_dump(exclude_unset=True, exclude_defaults=True)
+        config_overrides = self._config_overrides(conf) if conf else {}
         logger.debug("[%s] Config overrides: %s", self.name_id, config_overrides)
         # Determine and resolve model name
-        model_name = config_overrides.get("model", result_dict.get("model", ""))
+        model_name = config_overrides.get("model", self.default_config.model)
         logger.info("[%s] Configuring agent with model: %s", self.name_id, model_name)
         resolved_model = self._resolve_model_name(model_name)
         if resolved_model != model_name:
@@ -85,20 +80,23 @@ class ConfigResolverMixin:
         provider_config = self.provider_config or ModelProvidersConfig()
         logger.debug("[%s] Provider config has %s prefix mappings", self.name_id, len(provider_config.mappings))
         logger.debug("[%s] Provider config: %s", self.name_id, provider_config)
-        matched_mapping = self._find_provider_mapping(model_name, provider_config)
+        settings = provider_config.resolve(model_name)
+        if isinstance(settings, ProviderMapping):
+            logger.debug("[%s] Matched prefix '%s' for model '%s'", self.name_id, settings.prefix, model_name)
+        else:
+            logger.debug(
+                "[%s] No prefix match found for '%s', using default provider settings", self.name_id, model_name
+            )
 
         # Apply provider settings
-        self._apply_provider_setting(
-            "client", result_dict, config_overrides, matched_mapping=matched_mapping, provider_config=provider_config
-        )
-        self._apply_provider_setting(
-            "api_mode", result_dict, config_overrides, matched_mapping=matched_mapping, provider_config=provider_config
-        )
+        self._apply_provider_setting("client", result_dict, config_overrides, settings=settings)
+        self._apply_provider_setting("api_mode", result_dict, config_overrides, settings=settings)
 
-        # Finally, apply all config overrides
+        # Finally, apply all config overrides. Values come from validated configs,
+        # a copy is enough (no dump / re-validate round-trip)
         result_dict.update(config_overrides)
 
-        final_config = AgentConfig.model_validate(result_dict)
+        final_config = self.default_config.model_copy(update=result_dict, deep=True)
         logger.info(
             "[%s] Final configuration: model=%s, client=%s, api_mode=%s",
             self.name_id,
@@ -12,6 +12,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _is_empty_content(content) -> bool:
+    """True if content is None or an empty/whitespace-only string."""
+    return content is None or (isinstance(content, str) and not content.strip())
+
+
 class MessageHandlerMixin:
     """Mixin for handling agent messages."""
 
@@ -39,14 +44,17 @@ class MessageHandlerMixin:
         Returns:
             Filtered list of messages with empty content removed
         """
+        # Common case: nothing to filter, keep the list as is
+        if not any(_is_empty_content(message.get("content", "")) for message in messages):
+            return messages
+
         filtered_messages = []
         last_non_empty_content = ""
 
         for idx, message in enumerate(messages):
             content = message.get("content", "")
 
-            # Check if content is empty or whitespace only
-            if content is None or (isinstance(content, str) and not content.strip()):
+            if _is_empty_content(content):
                 # Get preview of previous non-empty message
                 preview = last_non_empty_content[:20] if last_non_empty_content else "(no previous message)"
                 if len(last_non_empty_content) > 20:
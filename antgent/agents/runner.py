@@ -1,18 +1,39 @@
 import logging
-from typing import TYPE_CHECKING, cast
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
-from agents import Runner, RunResult, custom_span
+from agents import Runner, RunResult, TResponseInputItem, custom_span
+from openai.types.responses import ResponseTextDeltaEvent
+from pydantic import BaseModel
+from pydantic_core import from_json
 
 from antgent.models.agent import PrepareRun, TLLMInput
-from antgent.utils.token import estimate_tokens
+from antgent.utils.token import encode_text, estimate_tokens_cached, truncate_tokens
 
 if TYPE_CHECKING:
     from antgent.agents.base import BaseAgent, TContext, TOutput
 
 logger = logging.getLogger(__name__)
 
+# stream() partial outputs: parsed every STREAM_PARSE_MIN_CHARS at first, then every 1/STREAM_PARSE_GROWTH growth
+STREAM_PARSE_MIN_CHARS = 64
+STREAM_PARSE_GROWTH = 4
 
-class ContextTooLargeError(ValueError): ...
+
+class ContextTooLargeError(ValueError):
+    def __init__(self, message: str, ntokens: int = 0, max_tokens: int = 0) -> None:
+        super().__init__(message)
+        self.ntokens = ntokens
+        self.max_tokens = max_tokens
+
+
+@lru_cache(maxsize=64)
+def _cached_max_tokens(model: str) -> int:
+    """Model context size from litellm metadata, looked up once per process and model."""
+    from litellm.utils import get_max_tokens  # noqa: PLC0415
+
+    return get_max_tokens(model) or 0
 
 
 class AgentRunnerMixin[TContext, TOutput]:
@@ -33,14 +54,9 @@ class AgentRunnerMixin[TContext, TOutput]:
             return None
         return response
 
-    async def run_result(
-        self: "BaseAgent[TContext, TOutput]",
-        agent,
-        llm_input: TLLMInput,
-        context: TContext,
-        check_tokens: bool = False,
-        **kwargs,
-    ) -> RunResult | None:
+    async def _prepare_run(
+        self: "BaseAgent[TContext, TOutput]", llm_input: TLLMInput, context: TContext, check_tokens: bool
+    ) -> PrepareRun[TContext] | None:
         with custom_span("Prepare input"):
             prep_run = await self.prep_input(llm_input, context)
             if prep_run.short_cut:
@@ -51,9 +67,26 @@ class AgentRunnerMixin[TContext, TOutput]:
             if isinstance(prep_run.llm_input, list):
                 prep_run.llm_input = self._filter_empty_messages(prep_run.llm_input)
 
-            if check_tokens and self.max_tokens > 0 and self.count_tokens(prep_run.llm_input) > self.max_tokens:
-                raise ContextTooLargeError(f"Input too large: {self.count_tokens(prep_run.llm_input)} tokens")
+            if check_tokens:
+                self._check_tokens(prep_run.llm_input)
+        return prep_run
+
+    async def run_result(
+        self: "BaseAgent[TContext, TOutput]",
+        agent,
+        llm_input: TLLMInput,
+        context: TContext,
+        check_tokens: bool = False,
+        **kwargs,
+    ) -> RunResult | None:
+        prep_run = await self._prepare_run(llm_input, context, check_tokens)
+        if prep_run is None:
+            return None
+        return await self._run_prepared(agent, prep_run, context, **kwargs)
 
+    async def _run_prepared(
+        self: "BaseAgent[TContext, TOutput]", agent, prep_run: PrepareRun[TContext], context: TContext, **kwargs
+    ) -> RunResult | None:
         # Merge frozen config run_kwargs with runtime kwargs (runtime takes precedence)
         merged_kwargs = {**self.agent_config.run_kwargs, **kwargs}
         res = await Runner.run(agent, input=prep_run.llm_input, context=prep_run.context, **merged_kwargs)
@@ -72,17 +105,134 @@ class AgentRunnerMixin[TContext, TOutput]:
             return None
         return cast(TOutput, res.final_output)
 
+    async def stream(
+        self: "BaseAgent[TContext, TOutput]",
+        llm_input: TLLMInput,
+        context: TContext,
+        check_tokens: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[TOutput]:
+        """
+        Streams the run: yields partial structured outputs (built with model_construct, fields missing until
+        decoded) as the JSON comes in, then the final validated output. prep_response is not applied.
+        Partial outputs are throttled: the buffer is re-parsed once it grew by a quarter (at least 64 chars).
+        """
+        prep_run = await self._prepare_run(llm_input, context, check_tokens)
+        if prep_run is None:
+            return
+
+        merged_kwargs = {**self.agent_config.run_kwargs, **kwargs}
+        result = Runner.run_streamed(self.agent(), input=prep_run.llm_input, context=prep_run.context, **merged_kwargs)
+        output_cls = self.agent_config.get_structured_cls()
+        partial_cls = output_cls if isinstance(output_cls, type) and issubclass(output_cls, BaseModel) else None
+
+        chunks: list[str] = []
+        size = parsed_size = 0
+        async for event in result.stream_events():
+            if (
+                partial_cls is None
+                or event.type != "raw_response_event"
+                or not isinstance(event.data, ResponseTextDeltaEvent)
+            ):
+                continue
+            chunks.append(event.data.delta)
+            size += len(event.data.delta)
+            # Re-parse only once the buffer grew by a fraction of what was parsed: linear work overall
+            if size - parsed_size < max(STREAM_PARSE_MIN_CHARS, parsed_size // STREAM_PARSE_GROWTH):
+                continue
+            parsed_size = size
+            buffer = "".join(chunks)
+            chunks = [buffer]
+            try:
+                data = from_json(buffer, allow_partial="trailing-strings")
+            except ValueError:
+                continue
+            if isinstance(data, dict):
+                yield cast(TOutput, partial_cls.model_construct(**data))
+
+        if result.final_output is not None:
+            yield cast(TOutput, result.final_output)
+
+    def _check_tokens(self: "BaseAgent[TContext, TOutput]", content) -> None:
+        """Raises ContextTooLargeError if content exceeds the model window, no-op when it is unknown."""
+        max_tokens = self.max_tokens
+        if max_tokens <= 0:
+            return
+        ntokens = self.count_tokens(content)
+        if ntokens > max_tokens:
+            raise ContextTooLargeError(f"Input too large: {ntokens} tokens", ntokens=ntokens, max_tokens=max_tokens)
+
+    async def run_truncated(
+        self: "BaseAgent[TContext, TOutput]",
+        agent,
+        llm_input: TLLMInput,
+        context: TContext,
+        **kwargs,
+    ) -> TOutput | None:
+        """
+        Runs with the token check; if the prepared input is too large, the overflow is cut from the end of its
+        largest text (the content, wherever prep_input put it) and the input is checked again before running.
+        Raises ContextTooLargeError if the input can't be made to fit.
+        """
+        prep_run = await self._prepare_run(llm_input, context, check_tokens=False)
+        if prep_run is None:
+            return None
+        prep_run.llm_input = self._fit_input(prep_run.llm_input)
+        res = await self._run_prepared(agent, prep_run, context, **kwargs)
+        if res is None:
+            return None
+        return cast(TOutput, res.final_output)
+
+    def _fit_input(self: "BaseAgent[TContext, TOutput]", llm_input: TLLMInput) -> TLLMInput:
+        """Returns llm_input with its largest text truncated by the token overflow, checked against the window."""
+        try:
+            self._check_tokens(llm_input)
+            return llm_input
+        except ContextTooLargeError as e:
+            error = e
+
+        fitted: TLLMInput
+        if isinstance(llm_input, str):
+            fitted = self._cut_overflow(llm_input, error)
+        else:
+            messages = cast(list[dict[str, Any]], list(llm_input))
+            texts = [
+                (idx, msg["content"])
+                for idx, msg in enumerate(messages)
+                if isinstance(msg, dict) and isinstance(msg.get("content"), str)
+            ]
+            if not texts:
+                raise error
+            # Longest in chars: only the chosen text is tokenized (encode_text keeps just a few texts)
+            index, text = max(texts, key=lambda t: len(t[1]))
+            messages[index] = {**messages[index], "content": self._cut_overflow(text, error)}
+            fitted = cast(list[TResponseInputItem], messages)
+        # Message overhead and re-tokenization at the cut can still overflow: checked again, raises if so
+        self._check_tokens(fitted)
+        return fitted
+
+    def _cut_overflow(self: "BaseAgent[TContext, TOutput]", text: str, error: ContextTooLargeError) -> str:
+        """Cuts the tokens text is over the window by, re-raises error if that leaves nothing."""
+        overflow = error.ntokens - error.max_tokens
+        keep = len(encode_text(self.model, text)) - overflow
+        if keep <= 0:
+            raise error
+        logger.warning("[%s] Input too large by %s tokens, truncating", self.name_id, overflow)
+        return self.truncate(text, keep)
+
+    def truncate(self: "BaseAgent[TContext, TOutput]", content: str, max_tokens: int | None = None) -> str:
+        """Cuts content to max_tokens tokens (defaults to the model window)."""
+        if max_tokens is None:
+            max_tokens = self.max_tokens
+        return truncate_tokens(self.model, content, max_tokens)
+
     def count_tokens(self: "BaseAgent[TContext, TOutput]", content) -> int:
-        return estimate_tokens(self.model, messages=content)
+        return estimate_tokens_cached(self.model, content)
 
     @property
     def max_tokens(self: "BaseAgent[TContext, TOutput]") -> int:
         if self._max_tokens is None:
-            from litellm.utils import get_max_tokens  # noqa: PLC0415
-
-            maxtokens = get_max_tokens(self.model)
-            if maxtokens is None:
-                maxtokens = 0
+            maxtokens = _cached_max_tokens(self.model)
             if self.conf.max_input_tokens and maxtokens > 0:
                 maxtokens = min(self.conf.max_input_tokens, maxtokens)
             self._max_tokens = maxtokens
@@ -0,0 +1,136 @@
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+
+from antgent.clients import openai_aclient
+from antgent.utils.token import encode_text
+
+from .models import SummaryInput
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """
+    In-process LRU cache of summaries with a TTL, keyed on a blake2b digest of everything that shapes
+    the output: agent, model, language, type, feedbacks and content.
+    Values are stored as JSON so cached results can't be mutated by callers.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def key(agent_name: str, model: str, ctx: SummaryInput) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for part in (agent_name, model, ctx.to_language, ctx.summary_type.value, *ctx.feedbacks):
+            h.update(part.encode())
+            h.update(b"\0")
+        h.update(ctx.content.encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drops one entry, or everything when key is None."""
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+
+class SemanticSummaryCache:
+    """
+    Near-duplicate cache of summaries: the content is embedded and the closest entry within the same
+    scope (agent, model, language, type, feedbacks) is returned when its cosine similarity reaches the
+    threshold. Vectors are normalized on insert, lookup is a linear scan over at most maxsize entries.
+    Content longer than the embedding model input (max_input_tokens) is not embedded and never cached:
+    a prefix embedding would match documents that only differ after the cut.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.97,
+        maxsize: int = 1024,
+        embedding_model: str = "text-embedding-3-small",
+        project_name: str = "openai",
+        max_input_tokens: int = 8191,
+    ) -> None:
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.embedding_model = embedding_model
+        self.project_name = project_name
+        self.max_input_tokens = max_input_tokens
+        self._data: OrderedDict[int, tuple[str, tuple[float, ...], str]] = OrderedDict()
+        self._next_id = 0
+
+    @staticmethod
+    def scope(agent_name: str, model: str, ctx: SummaryInput) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for part in (agent_name, model, ctx.to_language, ctx.summary_type.value, *ctx.feedbacks):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def fits(self, content: str) -> bool:
+        """True if content is within the embedding model input, short content (a token is >= 1 byte) isn't encoded."""
+        if len(content.encode()) <= self.max_input_tokens:
+            return True
+        return len(encode_text(self.embedding_model, content)) <= self.max_input_tokens
+
+    async def embed(self, content: str) -> tuple[float, ...] | None:
+        """Returns the normalized embedding of content, None if it is too long or the embedding call failed."""
+        if not self.fits(content):
+            logger.debug("Semantic cache skipped: content over %s tokens", self.max_input_tokens)
+            return None
+        try:
+            response = await openai_aclient(self.project_name).embeddings.create(
+                model=self.embedding_model, input=content
+            )
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return None
+        vector = response.data[0].embedding
+        norm = math.sqrt(math.sumprod(vector, vector)) or 1.0
+        return tuple(x / norm for x in vector)
+
+    def get(self, scope: str, vector: tuple[float, ...]) -> str | None:
+        best_id, best_sim = None, self.threshold
+        for entry_id, (entry_scope, entry_vector, _) in self._data.items():
+            if entry_scope != scope:
+                continue
+            sim = math.sumprod(vector, entry_vector)
+            if sim >= best_sim:
+                best_id, best_sim = entry_id, sim
+        if best_id is None:
+            return None
+        self._data.move_to_end(best_id)
+        return self._data[best_id][2]
+
+    def set(self, scope: str, vector: tuple[float, ...], value: str) -> None:
+        self._data[self._next_id] = (scope, vector, value)
+        self._next_id += 1
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self._data.clear()
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import logging
 
 from agents.tracing import custom_span
@@ -10,8 +12,10 @@ from antgent.agents.summarizer.models import (
     SummaryInput,
     SummaryOutput,
     SummaryType,
+    SummaryWithGrade,
 )
 from antgent.agents.summarizer.summary import SummaryAgent
+from antgent.agents.summarizer.summary_graded import SummaryGradedAgent, SummaryPrettyGradedAgent
 from antgent.agents.summarizer.summary_judge import SummaryJudgeAgent
 from antgent.agents.summarizer.summary_pretty import (
     SummaryPrettyAgent,
@@ -22,65 +26,111 @@ from antgent.models.agent import AgentConfig
 logger = logging.getLogger(__name__)
 
 
+# summary type -> (summarizer, combined summarizer+grader, judge)
+_AGENTS_BY_TYPE: dict[SummaryType, tuple[type[SummaryAgent], type[SummaryAgent], type[SummaryJudgeAgent]]] = {
+    SummaryType.PRETTY: (SummaryPrettyAgent, SummaryPrettyGradedAgent, SummaryPrettyJudgeAgent),
+    SummaryType.MACHINE: (SummaryAgent, SummaryGradedAgent, SummaryJudgeAgent),
+}
+
+
+def _select_agents(
+    ctx: SummaryInput, agentsconf: dict[str, AgentConfig], combined: bool
+) -> tuple[SummaryAgent, SummaryJudgeAgent]:
+    """Returns the (summarizer, judge) agents for the summary type."""
+    summarize_cls, graded_cls, judge_cls = _AGENTS_BY_TYPE[ctx.summary_type]
+    if combined:
+        summarize_cls = graded_cls
+    return summarize_cls(conf=agentsconf), judge_cls(conf=agentsconf)
+
+
+def _is_good_enough(summary_grade: SummaryGrade) -> bool:
+    return summary_grade.grade >= 8 or (len(summary_grade.missing_entities) == 0 and summary_grade.grade > 6)
+
+
+def _best_index(summaries: list[SummaryOutput], grades: list[SummaryGrade]) -> int:
+    if not grades:
+        # If there are no grades (e.g., iterations=1), the best summary is the last one generated.
+        return len(summaries) - 1
+    # Highest grade, later iterations win ties
+    return max(range(len(grades)), key=lambda i: (grades[i].grade, i))
+
+
 async def summarize_one_type(ctx: SummaryInput, agentsconf: dict[str, AgentConfig]) -> InternalSummaryResult:
     """Helper function to run one type of summarization logic."""
-    if ctx.summary_type == SummaryType.PRETTY:
-        summarize_agent = SummaryPrettyAgent(conf=agentsconf)
-        judge_agent = SummaryPrettyJudgeAgent(conf=agentsconf)
-    else:
-        summarize_agent = SummaryAgent(conf=agentsconf)
-        judge_agent = SummaryJudgeAgent(conf=agentsconf)
+    iterations = ctx.iterations or 1
 
-    iterations = ctx.iterations
-    if iterations == 0:
-        iterations = 1
+    # A single call per iteration both summarizes and grades; useless without a retry loop
+    combined = ctx.combined_grading and iterations > 1
+    summarize_agent, judge_agent = _select_agents(ctx, agentsconf, combined)
 
+    # Next iteration's generation, started while the current summary is being judged
+    speculative = ctx.speculative and not combined
+    next_summary: asyncio.Task | None = None
+
+    original_text = ctx.content
     i = 0
     summaries: list[SummaryOutput] = []
     grades: list[SummaryGrade] = []
     with custom_span(f"{summarize_agent.name_id} loop", data={}):
-        while i < iterations:
-            i += 1
-            with custom_span(
-                f"Iteration {i}", data={"iteration": i, "grades": ",".join([str(g.grade) for g in grades])}
-            ):
-                logger.info(f"Running summary iteration {i}, grades: {[g.grade for g in grades]}")
-                summary = await summarize_agent.workflow(llm_input="", context=ctx)
-                if summary is None:
-                    logger.error("No summary generated, trying again")
-                    continue
-                summaries.append(summary)
-
-                if iterations == 1:
-                    break
-
-                logger.info("Grading summary")
-                grade_ctx = SummaryGradeCtx(**summary.model_dump(), original_text=ctx.content)
-                summary_grade = await judge_agent.workflow(llm_input="", context=grade_ctx)
-                if summary_grade is None:
-                    break
-                grades.append(summary_grade)
-
-                if summary_grade.grade >= 8 or (len(summary_grade.missing_entities) == 0 and summary_grade.grade > 6):
-                    break  # Summary is good enough return
-
-                # Create new summary with feedbacks
-                ctx.feedbacks = summary_grade.feedbacks
+        try:
+            while i < iterations:
+                i += 1
+                with custom_span(
+                    f"Iteration {i}", data={"iteration": i, "grades": ",".join([str(g.grade) for g in grades])}
+                ):
+                    logger.info(f"Running summary iteration {i}, grades: {[g.grade for g in grades]}")
+                    if next_summary is not None:
+                        summary, next_summary = await next_summary, None
+                    else:
+                        summary = await summarize_agent.workflow(llm_input="", context=ctx)
+                    if summary is None:
+                        logger.error("No summary generated, trying again")
+                        continue
+
+                    if isinstance(summary, SummaryWithGrade):
+                        summary, summary_grade = summary.split()
+                        summaries.append(summary)
+                    else:
+                        summaries.append(summary)
+
+                        if iterations == 1:
+                            break
+
+                        logger.info("Grading summary")
+                        # summary is already validated, skip the dump/validate round-trip
+                        grade_ctx = SummaryGradeCtx.model_construct(**summary.__dict__, original_text=original_text)
+                        if speculative and i < iterations:
+                            # ctx is replaced, never mutated, between iterations: safe to share with the task.
+                            # Same ctx as the summary being judged: the cache would return that very summary
+                            next_summary = asyncio.create_task(
+                                summarize_agent.workflow(llm_input="", context=ctx, use_cache=False)
+                            )
+                        summary_grade = await judge_agent.workflow(llm_input="", context=grade_ctx)
+                        if summary_grade is None:
+                            break
+                    grades.append(summary_grade)
+
+                    if _is_good_enough(summary_grade):
+                        break  # Summary is good enough return
+
+                    # Create new summary with feedbacks, shallow copy: content is shared, caller's ctx untouched
+                    ctx = ctx.model_copy(update={"feedbacks": summary_grade.feedbacks})
+        finally:
+            if next_summary is not None:
+                # The judge accepted the summary (or failed), drop the speculative generation and wait for it
+                # to unwind; its outcome, failure included, is discarded
+                next_summary.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_summary
 
     if not summaries:
         raise ApplicationError("No summaries generated")
 
-    best = 0
-    if grades:
-        for i, grade in enumerate(grades):
-            if grade.grade >= grades[best].grade:
-                best = i
-    else:
-        # If there are no grades (e.g., iterations=1), the best summary is the last one generated.
-        best = len(summaries) - 1
-
     result = InternalSummaryResult(
-        summary=summaries[best], grades=grades, summaries=summaries, summary_type=ctx.summary_type
+        summary=summaries[_best_index(summaries, grades)],
+        grades=grades,
+        summaries=summaries,
+        summary_type=ctx.summary_type,
     )
 
     return result
@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SummaryType(StrEnum):
@@ -20,14 +20,29 @@ class SummaryInput(BaseModel):
     )
     summary_type: SummaryType = Field(default=SummaryType.MACHINE, description="The type of summary to generate.")
     iterations: int = Field(default=1, description="Number of iterations for summarization and grading.")
+    combined_grading: bool = Field(
+        default=False,
+        description=(
+            "Generate and grade the summary in a single LLM call per iteration instead of a separate judge call."
+        ),
+    )
+    speculative: bool = Field(
+        default=False,
+        description=(
+            "Start the next iteration's summary while the current one is graded. Cuts latency when several "
+            "iterations are needed, at the cost of the next summary not seeing the latest feedbacks."
+        ),
+    )
 
 
 class Entity(BaseModel):
+    model_config = ConfigDict(frozen=True)
     name: str = Field(..., description="Name of the entity")
     type: str = Field(..., description="Type of the entity. E.g., 'name', 'date', 'number', 'place', etc.")
 
 
 class GradeFeedback(BaseModel):
+    model_config = ConfigDict(frozen=True)
     grade: int = Field(..., description="Grade of the assignment, from 0 to 10")
     feedbacks: list[str] = Field(..., description="Feedbacks to improve the assignment")
     grade_reasoning: str = Field(
@@ -55,6 +70,14 @@ class SummaryOutput(BaseModel):
     language: str = Field(..., description="The language of the output text. E.g., 'en' for English. 'de' for German.")
 
 
+class SummaryWithGrade(SummaryOutput, SummaryGrade):
+    """Summary and its self-assessment, produced in a single structured response."""
+
+    def split(self) -> tuple[SummaryOutput, SummaryGrade]:
+        data = self.model_dump()
+        return SummaryOutput.model_validate(data), SummaryGrade.model_validate(data)
+
+
 class SummaryGradeCtx(SummaryOutput):
     original_text: str = Field(..., description="The original text")
 
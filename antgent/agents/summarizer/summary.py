@@ -1,10 +1,31 @@
+import asyncio
+
 from agents import TResponseInputItem
 
 from antgent.agents.base import BaseAgent
 from antgent.models.agent import AgentConfig, AgentFrozenConfig, PrepareRun, TLLMInput
+from antgent.utils.token import encode_text, split_by_tokens
 
+from .cache import SemanticSummaryCache, SummaryCache
 from .models import SummaryInput, SummaryOutput
 
+OUTPUT_FORMAT = """
+# Output Format
+
+Produce a json output, fields are:
+- short_version: {short_version}
+- description: {description}
+- title: Title for the table of contents.
+- language: The language of the original text. E.g., 'en' for English, 'de' for German.
+- tags: List of tags for indexing
+"""
+
+
+def output_format(short_version: str, description: str) -> str:
+    return OUTPUT_FORMAT.format(short_version=short_version, description=description).strip()
+
+
+# Prompts are stripped and formatted once at import, they are sent on every request
 PROMPT = """
 Generate a comprehensive and detailed shorter version of the given text in the same language as the original text.
 Additionally, include a short description, a title for the table of contents, and tags for indexing.
@@ -32,28 +53,25 @@ the context about what was wrong with your previous summary
 8. **Additional Content**: Add a short description (2-3 sentences) of the text, a suitable document title for a
    table of contents, and a list of tags for indexing
 
-# Output Format
-
-Produce a json output
-fields are:
-    short_version: str = Field(..., description="The shorter version but accurate and exaustive of the original text."
- " in Markdown format with clear headings and paragraphs")
-    description: str = Field(..., description="A short description of the content, 2-3 sentences")
-    title: str = Field(..., description="Title for the table of contents.")
-    language: str = Field(...,
-                          description="The language of the original text. E.g., 'en' for English. 'de' for German.",
-                          examples=["en", 'de', 'fr'])
-
-    tags: list[str] = Field(default_factory=list, description="List of tags for indexing")
-
-
+{output_format}
 
 # Notes
 
 - When uncertain about the importance of information, include it to preserve the context fully.
-- The most import is to not lose any information. Reducing size is secondary"
+- The most import is to not lose any information. Reducing size is secondary
+""".format(
+    output_format=output_format(
+        "The shorter version but accurate and exaustive of the original text, in Markdown format with clear "
+        "headings and paragraphs",
+        "A short description of the content, 2-3 sentences",
+    )
+).strip()
 
-"""
+
+# Map-reduce of very long content, enabled with the `chunk_tokens` agent config extra
+CHUNK_OVERLAP_TOKENS = 256
+CHUNK_CONCURRENCY = 8
+MAX_CHUNK_DEPTH = 2
 
 
 class SummaryAgent(BaseAgent[SummaryInput, SummaryOutput]):
@@ -65,15 +83,103 @@ class SummaryAgent(BaseAgent[SummaryInput, SummaryOutput]):
         description="Summarize the text and provide a shorter version with all the information",
         model="gemini/gemini-pro",
     )
+    cache: SummaryCache | None = None
+    semantic_cache: SemanticSummaryCache | None = None
+
+    @classmethod
+    def set_cache(cls, cache: SummaryCache | None) -> None:
+        """Enable (or disable with None) the summary cache for this agent class and its subclasses."""
+        cls.cache = cache
+
+    @classmethod
+    def set_semantic_cache(cls, cache: SemanticSummaryCache | None) -> None:
+        """Enable (or disable with None) the near-duplicate cache, consulted after the exact one."""
+        cls.semantic_cache = cache
 
     def prompt(self) -> str:
         return PROMPT
 
+    async def workflow(
+        self, llm_input: TLLMInput, context: SummaryInput, *, use_cache: bool = True
+    ) -> SummaryOutput | None:
+        """
+        With use_cache=False the caches aren't read (a fresh summary is generated) but the result is
+        still stored, e.g. for a retry that would otherwise get the cached summary it retries.
+        """
+        return await self._maybe_chunk(llm_input, context, depth=0, use_cache=use_cache)
+
+    async def _maybe_chunk(
+        self, llm_input: TLLMInput, context: SummaryInput, depth: int, use_cache: bool = True
+    ) -> SummaryOutput | None:
+        """
+        Content longer than `chunk_tokens` is split on paragraphs, the chunks are summarized in parallel
+        and their shorter versions are summarized again (reduce step), at most MAX_CHUNK_DEPTH levels deep.
+        """
+        chunk_tokens = (self.conf.model_extra or {}).get("chunk_tokens")
+        if (
+            not chunk_tokens
+            or llm_input
+            or depth >= MAX_CHUNK_DEPTH
+            or len(encode_text(self.model, context.content)) <= chunk_tokens
+        ):
+            return await self._cached_workflow(llm_input, context, use_cache)
+
+        chunks = split_by_tokens(self.model, context.content, chunk_tokens, overlap=CHUNK_OVERLAP_TOKENS)
+        if len(chunks) <= 1:
+            return await self._cached_workflow(llm_input, context, use_cache)
+
+        semaphore = asyncio.Semaphore(CHUNK_CONCURRENCY)
+
+        async def summarize_chunk(chunk: str) -> SummaryOutput | None:
+            async with semaphore:
+                chunk_ctx = context.model_copy(update={"content": chunk})
+                return await self._cached_workflow(llm_input, chunk_ctx, use_cache)
+
+        summaries = await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks))
+        reduced = "\n\n".join(summary.short_version for summary in summaries if summary is not None)
+        if not reduced:
+            return None
+        reduced_ctx = context.model_copy(update={"content": reduced})
+        return await self._maybe_chunk(llm_input, reduced_ctx, depth + 1, use_cache)
+
+    async def _cached_workflow(
+        self, llm_input: TLLMInput, context: SummaryInput, use_cache: bool = True
+    ) -> SummaryOutput | None:
+        if llm_input or (self.cache is None and self.semantic_cache is None):
+            return await super().workflow(llm_input, context)
+
+        output_cls = self.agent_config.output_cls or SummaryOutput
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self.name_id, self.model, context)
+            cached = self.cache.get(key) if use_cache else None
+            if cached is not None:
+                return output_cls.model_validate_json(cached)
+
+        scope, vector = "", None
+        if self.semantic_cache is not None:
+            scope = self.semantic_cache.scope(self.name_id, self.model, context)
+            vector = await self.semantic_cache.embed(context.content)
+            cached = self.semantic_cache.get(scope, vector) if use_cache and vector is not None else None
+            if cached is not None:
+                return output_cls.model_validate_json(cached)
+
+        summary = await super().workflow(llm_input, context)
+        if summary is not None:
+            dumped = summary.model_dump_json()
+            if self.cache is not None and key is not None:
+                self.cache.set(key, dumped)
+            if self.semantic_cache is not None and vector is not None:
+                self.semantic_cache.set(scope, vector, dumped)
+        return summary
+
     async def prep_input(self, llm_input: TLLMInput, ctx: SummaryInput) -> PrepareRun[SummaryInput]:
-        messages: list[TResponseInputItem] = []
+        # Single user message built with one join
+        parts: list[str] = []
         if ctx.feedbacks:
-            messages.append({"role": "user", "content": f"Previous summary feedbacks: {';'.join(ctx.feedbacks)}\n"})
-        messages.append({"role": "user", "content": f"Generate summaries and text in Language: {ctx.to_language}\n"})
-        messages.append({"role": "user", "content": f"Original Text:\n{ctx.content}\n"})
+            parts += ("Previous summary feedbacks: ", ";".join(ctx.feedbacks), "\n")
+        parts += ("Generate summaries and text in Language: ", ctx.to_language, "\n")
+        parts += ("Original Text:\n", ctx.content, "\n")
+        messages: list[TResponseInputItem] = [{"role": "user", "content": "".join(parts)}]
         self.add_inputs(llm_input, messages)
         return PrepareRun(llm_input=messages, context=ctx, short_cut=False)
@@ -0,0 +1,66 @@
+from agents import ModelSettings
+
+from antgent.agents.summarizer import summary, summary_pretty
+from antgent.agents.summarizer.summary import SummaryAgent
+from antgent.agents.summarizer.summary_pretty import SummaryPrettyAgent
+from antgent.models.agent import AgentConfig, AgentFrozenConfig
+
+from .models import SummaryWithGrade
+
+GRADE_INSTRUCTIONS = """
+# Self Grading
+
+Once the output is written, review it against the original text as a strict reviewer would and grade it.
+{criteria}
+
+Add the grading to the same json output, extra fields are:
+- grade: Grade of the output, from 0 to 10
+- feedbacks: List of feedbacks to improve the output
+- grade_reasoning: Reasoning for the grade, what was good and what was bad
+- missing_entities: Entities of the original text missing in the output (fields: name, type), keep empty if none
+""".strip()
+
+MACHINE_CRITERIA = """Grade from 0-10, 0 being non-sense, 10 being the best.
+The shorter version must contain ALL entities, date, place, people, addresses, amounts.
+1. If one entity is missing, the grade can't be more than 5, it's a critical mistake
+2. A perfect shorter version is short but still retains 100% of the information
+3. Take away points for every information that is missing"""
+
+PRETTY_CRITERIA = """Grade from 0-10, 0 being non-sense, 10 being the best.
+The summary must be short, concise, and to the point, with a fitting description and title.
+The reader already knows most of the context, there's no need to explain it."""
+
+
+class SummaryGradedAgent(SummaryAgent):
+    """Generates the summary and grades it in one round-trip, replacing SummaryAgent + SummaryJudgeAgent."""
+
+    name_id = "SummaryGraded"
+    agent_config = AgentFrozenConfig(output_cls=SummaryWithGrade, structured=True, run_kwargs={"max_turns": 1})
+    default_config = AgentConfig(
+        name="SummaryGraded",
+        client="litellm",
+        description="Summarize the text and grade the shorter version in a single response",
+        model="gemini/gemini-pro",
+    )
+
+    def prompt(self) -> str:
+        return f"{summary.PROMPT}\n\n{GRADE_INSTRUCTIONS.format(criteria=MACHINE_CRITERIA)}"
+
+
+class SummaryPrettyGradedAgent(SummaryPrettyAgent):
+    """Pretty summary variant of SummaryGradedAgent."""
+
+    name_id = "SummaryPrettyGraded"
+    agent_config = AgentFrozenConfig(output_cls=SummaryWithGrade, structured=True, run_kwargs={"max_turns": 1})
+    default_config = AgentConfig(
+        name="SummaryPrettyGraded",
+        client="litellm",
+        description="Create a short summary of the content and grade it in a single response",
+        model="gemini/gemini-pro",
+        model_settings=ModelSettings(
+            tool_choice="none",
+        ),
+    )
+
+    def prompt(self) -> str:
+        return f"{summary_pretty.PROMPT}\n\n{GRADE_INSTRUCTIONS.format(criteria=PRETTY_CRITERIA)}"
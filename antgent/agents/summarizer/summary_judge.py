@@ -27,8 +27,7 @@ Provide the feedbacks as json
  " verbose text"
 
 }
-
-"""
+""".strip()
 
 
 class SummaryJudgeAgent(BaseAgent[SummaryGradeCtx, SummaryGrade]):
@@ -48,9 +47,9 @@ class SummaryJudgeAgent(BaseAgent[SummaryGradeCtx, SummaryGrade]):
         return PROMPT
 
     async def prep_input(self, llm_input: TLLMInput, ctx: SummaryGradeCtx) -> PrepareRun[SummaryGradeCtx]:
-        messages: list[TResponseInputItem] = [
-            {"role": "user", "content": f"\n-------\nOriginal text:\n {ctx.original_text}"},
-            {"role": "user", "content": f"\n-------\nLess Verbose Text:\n {ctx.short_version}"},
-        ]
+        content = "".join(
+            ("\n-------\nOriginal text:\n ", ctx.original_text, "\n-------\nLess Verbose Text:\n ", ctx.short_version)
+        )
+        messages: list[TResponseInputItem] = [{"role": "user", "content": content}]
         self.add_inputs(llm_input, messages)
         return PrepareRun(llm_input=messages, context=ctx, short_cut=False)
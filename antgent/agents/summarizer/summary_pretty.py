@@ -1,6 +1,6 @@
 from agents import ModelSettings, TResponseInputItem
 
-from antgent.agents.summarizer.summary import SummaryAgent
+from antgent.agents.summarizer.summary import SummaryAgent, output_format
 from antgent.agents.summarizer.summary_judge import SummaryJudgeAgent
 from antgent.models.agent import AgentConfig, AgentFrozenConfig, PrepareRun, TLLMInput
 
@@ -32,20 +32,13 @@ For example:
 "In The text...." or "In the document...."  or "In the email..." is not good, go directly to the point.
 
 
-# Output Format
-
-Produce a json output
-fields are:
-    short_version: str = Field(..., description="The summary. in Markdown format with clear headings and paragraphs")
-    description: str = Field(..., description="A short description of the content, 1 to 3 sentences")
-    title: str = Field(..., description="Title for the table of contents.")
-    language: str = Field(...,
-                          description="The language of the original text. E.g., 'en' for English. 'de' for German.",
-                          examples=["en", 'de', 'fr'])
-
-    tags: list[str] = Field(default_factory=list, description="List of tags for indexing")
-
-"""
+{output_format}
+""".format(
+    output_format=output_format(
+        "The summary, in Markdown format with clear headings and paragraphs",
+        "A short description of the content, 1 to 3 sentences",
+    )
+).strip()
 
 PROMPT_JUDGE: str = """
 You are a professional reviewer of summaries.
@@ -64,7 +57,7 @@ Provide the feedbacks as json
 "grade": 8,
 "grade_reasoning": "The summary is concise and to the point, but it could be improved by adding more details about X."
 }
-"""
+""".strip()
 
 
 class SummaryPrettyAgent(SummaryAgent):
@@ -101,11 +94,19 @@ class SummaryPrettyJudgeAgent(SummaryJudgeAgent):
         return PROMPT_JUDGE
 
     async def prep_input(self, llm_input: TLLMInput, ctx: SummaryGradeCtx) -> PrepareRun[SummaryGradeCtx]:
-        messages: list[TResponseInputItem] = [
-            {"role": "user", "content": f"\n-------\nOriginal text:\n {ctx.original_text}\n\n\n###\n"},
-            {"role": "user", "content": f"\n-------\nTitle:\n {ctx.title}\n"},
-            {"role": "user", "content": f"\n-------\nDescription:\n {ctx.description}\n"},
-            {"role": "user", "content": f"\n-------\nSummary:\n {ctx.short_version}\n"},
-        ]
+        content = "".join(
+            (
+                "\n-------\nOriginal text:\n ",
+                ctx.original_text,
+                "\n\n\n###\n\n-------\nTitle:\n ",
+                ctx.title,
+                "\n\n-------\nDescription:\n ",
+                ctx.description,
+                "\n\n-------\nSummary:\n ",
+                ctx.short_version,
+                "\n",
+            )
+        )
+        messages: list[TResponseInputItem] = [{"role": "user", "content": content}]
         self.add_inputs(llm_input, messages)
         return PrepareRun(llm_input=messages, context=ctx, short_cut=False)
@@ -1,4 +1,5 @@
-from functools import cache
+import logging
+from functools import cache, lru_cache
 
 from ant31box.client.filedl import DownloadClient
 from ant31box.s3 import S3Client
@@ -7,10 +8,12 @@ from openai import AsyncOpenAI, OpenAI
 
 from antgent.models.agent import LLMsConfigSchema
 
-__all__ = ["filedl_client", "genai_client", "openai_aclient", "openai_client", "s3_client"]
+__all__ = ["filedl_client", "genai_client", "openai_aclient", "openai_client", "s3_client", "warmup_clients"]
 
+logger = logging.getLogger(__name__)
 
-@cache
+
+@lru_cache(maxsize=16)
 def openai_client(project_name: str = "openai", llms: LLMsConfigSchema | None = None) -> OpenAI:
     """Create a OpenAI instance with the given api_key
     It cache the answer for the same api_key
@@ -38,7 +41,7 @@ def openai_client(project_name: str = "openai", llms: LLMsConfigSchema | None =
     return client
 
 
-@cache
+@lru_cache(maxsize=16)
 def openai_aclient(project_name: str = "openai", llms: LLMsConfigSchema | None = None) -> AsyncOpenAI:
     """Create a OpenAI instance with the given api_key
     It cache the answer for the same api_key
@@ -66,7 +69,7 @@ def openai_aclient(project_name: str = "openai", llms: LLMsConfigSchema | None =
     return client
 
 
-@cache
+@lru_cache(maxsize=16)
 def genai_client(project_name: str = "gemini", llms: LLMsConfigSchema | None = None) -> genai.Client:
     """Create a GenAI instance with the given api_key
     It cache the answer for the same api_key
@@ -113,3 +116,25 @@ def filedl_client(key: str = "") -> DownloadClient:
     client = DownloadClient()
     client.set_s3(config().s3)
     return client
+
+
+def warmup_clients(llms: LLMsConfigSchema | None = None) -> None:
+    """
+    Builds the default LLM and S3 clients ahead of the first request, with the same arguments as BaseAgent
+    and the uploader so the cached instances are the ones requests get.
+    Missing credentials are not an error here, the first real call will report them.
+    """
+    factories = (
+        ("openai_aclient", openai_aclient, "openai"),
+        ("openai_client", openai_client, "openai"),
+        ("genai_client", genai_client, "gemini"),
+    )
+    for name, factory, project_name in factories:
+        try:
+            factory(project_name, llms=llms)
+        except Exception as e:
+            logger.debug("Skipping %s warmup: %s", name, e)
+    try:
+        s3_client()
+    except Exception as e:
+        logger.debug("Skipping s3_client warmup: %s", e)
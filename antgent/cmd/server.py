@@ -5,10 +5,8 @@ from pathlib import Path
 from typing import Annotated
 
 import typer
-import uvicorn
 
 from antgent.config import config as confload
-from antgent.init import init
 
 app = typer.Typer()
 logger = logging.getLogger("ant31box.info")
@@ -69,6 +67,11 @@ def server(  # server_wrapper
         ),
     ] = None,
 ) -> None:
+    # uvicorn and the LLM/tracing stack are only needed once the server actually starts
+    import uvicorn  # noqa: PLC0415
+
+    from antgent.init import init  # noqa: PLC0415
+
     _config = confload(str(config) if config else None)
     if host is not None:
         _config.server.host = host
@@ -83,7 +86,7 @@ def server(  # server_wrapper
     if use_colors is not None:
         _config.logging.use_colors = use_colors
     logger.info("Starting server")
-    typer.echo(f"{_config.server.model_dump()}")
+    logger.debug("Server config: %r", _config.server)
     init(_config.conf, mode="server")
     uvicorn.run(
         _config.server.server,
@@ -1,7 +1,6 @@
 import json
 from typing import Annotated
 
-import tiktoken
 from ant31box.cmd.typer.models import OutputEnum
 from typer import Exit, Option, echo, get_text_stream
 
@@ -13,10 +12,12 @@ def tikcount(
     ] = OutputEnum.json,
 ) -> None:
     """Counts tokens from stdin."""
+    from antgent.utils.token import get_encoder  # noqa: PLC0415
+
     stdin_text = get_text_stream("stdin")
     model = "gpt-4o"
-    encoder = tiktoken.encoding_for_model(model)
-    res = {"tokens": len(encoder.encode(stdin_text.read())), "model": model}
+    encoder = get_encoder(model)
+    res = {"tokens": len(encoder.encode_ordinary(stdin_text.read())), "model": model}
     if output == "json":
         echo(json.dumps(res, indent=2))
     else:
@@ -7,7 +7,6 @@ from temporalloop.cmd import scheduler as scheduler_cmd
 from temporalloop.cmd.models import LogLevel
 
 from antgent.config import config
-from antgent.init import init
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -102,6 +101,8 @@ def looper_wrapper(  # pylint: disable=too-many-arguments
     ] = True,
 ):
     """Wrapper to initialize before starting the looper."""
+    from antgent.init import init  # noqa: PLC0415
+
     _config = config(str(config_path) if config_path else None)
     init(_config.conf, mode="worker")
 
@@ -1,5 +1,7 @@
 # pylint: disable=no-self-argument
+import base64
 import logging
+from functools import cached_property
 from typing import Any, Generic, Literal, TypeVar
 
 import ant31box.config
@@ -59,32 +61,66 @@ class AliasesSchema(RootModel):
 
 
 class LogfireConfigSchema(BaseConfig):
+    model_config = ConfigDict(frozen=True)
     token: str | None = Field(default=None)
     send_to_logfire: bool | Literal["if-token-present"] = Field(default="if-token-present")
     service_name: str = Field(default="")
 
 
 class LangfuseConfigSchema(BaseConfig):
+    model_config = ConfigDict(frozen=True)
     public_key: str = Field(default="pk-lf-989f33ac-ad6d-418f-b115-590d7c8b1c95")
     secret_key: str = Field(default="sk-lf-154576f9-d2d2-48c6-84a1-122f03c0a777")
     endpoint: str = Field(default="https://cloud.langfuse.com")
     export_otel: bool = Field(default=False)
 
+    @cached_property
+    def basic_auth(self) -> str:
+        """Base64 `public_key:secret_key`, for the OTLP Basic Authorization header."""
+        return base64.b64encode(f"{self.public_key}:{self.secret_key}".encode()).decode()
+
+
 class LoggingCustomConfigSchema(LoggingConfigSchema):
     log_config: dict[str, Any] | str | None = Field(default_factory=lambda: LOGGING_CONFIG)
 
 
 class TracesConfigSchema(BaseConfig):
+    model_config = ConfigDict(frozen=True)
     enabled: bool = Field(default=True)
     logfire: LogfireConfigSchema = Field(default_factory=LogfireConfigSchema)
     langfuse: LangfuseConfigSchema = Field(default_factory=LangfuseConfigSchema)
 
 
 class LiteLLMConfigSchema(BaseConfig):
+    model_config = ConfigDict(frozen=True)
     base_url: str | None = Field(default=None)
     token: str = Field(default="sk-ukiiHpNuHgI2ZqupmPUA4")
 
 
+class SemanticSummaryCacheConfigSchema(BaseConfig):
+    """Near-duplicate cache of SummaryAgent results (embedding similarity), off by default."""
+
+    model_config = ConfigDict(frozen=True)
+    enabled: bool = Field(default=False)
+    threshold: float = Field(default=0.97, description="Min cosine similarity for a cached summary to be reused")
+    maxsize: int = Field(default=1024, description="Max number of cached summaries, least recently used are evicted")
+    embedding_model: str = Field(default="text-embedding-3-small")
+    project_name: str = Field(default="openai", description="LLM client used for the embedding calls")
+    max_input_tokens: int = Field(
+        default=8191, description="Embedding model input limit, longer content bypasses the semantic cache"
+    )
+
+
+class SummaryCacheConfigSchema(BaseConfig):
+    """In-process cache of SummaryAgent results, off by default."""
+
+    model_config = ConfigDict(frozen=True)
+    enabled: bool = Field(default=False)
+    maxsize: int = Field(default=256, description="Max number of cached summaries, least recently used are evicted")
+    ttl: float = Field(default=3600.0, description="Seconds a cached summary stays valid")
+    semantic: SemanticSummaryCacheConfigSchema = Field(default_factory=SemanticSummaryCacheConfigSchema)
+
+
 class FastAPIConfigCustomSchema(FastAPIConfigSchema):
     server: str = Field(default="antgent.server.server:serve")
 
@@ -146,6 +182,7 @@ class ConfigSchema(ant31box.config.ConfigSchema):
     agents: AgentsConfigSchema = Field(default_factory=AgentsConfigSchema)
     traces: TracesConfigSchema = Field(default_factory=TracesConfigSchema)
     s3: S3ConfigSchema = Field(default_factory=S3ConfigSchema)
+    summary_cache: SummaryCacheConfigSchema = Field(default_factory=SummaryCacheConfigSchema)
 
 
 TConfigSchema = TypeVar("TConfigSchema", bound=ConfigSchema)  # pylint: disable= invalid-name
@@ -215,6 +252,10 @@ class AntgentConfig(Generic[TConfigSchema], GenericConfig[TConfigSchema]):
     def model_providers(self) -> ModelProvidersConfig:
         return self.conf.model_providers
 
+    @property
+    def summary_cache(self) -> SummaryCacheConfigSchema:
+        return self.conf.summary_cache
+
 
 class Config(AntgentConfig[ConfigSchema]):
     __config_class__: type[ConfigSchema] = ConfigSchema
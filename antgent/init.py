@@ -4,16 +4,14 @@ import logging
 import os
 from typing import Any, Literal
 
-import litellm
-import logfire
 from agents import set_trace_processors, set_tracing_export_api_key
-from langfuse import get_client
-from openinference.instrumentation.openai_agents import OpenAIAgentsInstrumentor
 
 from antgent.agents.base import BaseAgent
 from antgent.aliases import Aliases
-from antgent.config import ConfigSchema, LangfuseConfigSchema, LogfireConfigSchema
+from antgent.clients import warmup_clients
+from antgent.config import ConfigSchema, LangfuseConfigSchema, LogfireConfigSchema, SummaryCacheConfigSchema
 from antgent.models.agent import LLMConfigSchema
+from antgent.utils.token import preload_encoder
 
 logger = logging.getLogger(__name__)
 
@@ -23,10 +21,14 @@ def init_envs_langfuse(config: LangfuseConfigSchema, mode: Literal["server", "wo
     if not extra:
         extra = {}
     logger.info("Setting up Langfuse environment variables: pk:%s env:%s", config.public_key, extra.get("env", "dev"))
-    os.environ["LANGFUSE_PUBLIC_KEY"] = os.environ.get("LANGFUSE_PUBLIC_KEY", config.public_key)
-    os.environ["LANGFUSE_SECRET_KEY"] = os.environ.get("LANGFUSE_SECRET_KEY", config.secret_key)
-    os.environ["LANGFUSE_HOST"] = os.environ.get("LANGFUSE_HOST", config.endpoint)
-    os.environ["LANGFUSE_TRACING_ENVIRONMENT"] = extra.get("env", "dev")
+    env = os.environ
+    public_key = env.setdefault("LANGFUSE_PUBLIC_KEY", config.public_key)
+    secret_key = env.setdefault("LANGFUSE_SECRET_KEY", config.secret_key)
+    host = env.setdefault("LANGFUSE_HOST", config.endpoint)
+    env["LANGFUSE_TRACING_ENVIRONMENT"] = extra.get("env", "dev")
+
+    from langfuse import get_client  # noqa: PLC0415
+    from openinference.instrumentation.openai_agents import OpenAIAgentsInstrumentor  # noqa: PLC0415
 
     # Verify connection
     langfuse = get_client()
@@ -35,16 +37,18 @@ def init_envs_langfuse(config: LangfuseConfigSchema, mode: Literal["server", "wo
     else:
         logger.error("❌ Authentication failed. Please check your credentials and host.")
 
-    # Build Basic Auth header.
-    langfuse_auth = base64.b64encode(
-        f"{os.environ.get('LANGFUSE_PUBLIC_KEY')}:{os.environ.get('LANGFUSE_SECRET_KEY')}".encode()
-    ).decode()
     OpenAIAgentsInstrumentor().instrument()
 
+    # Configure OpenTelemetry endpoint & headers, unless already set (env or a previous init)
     if config.export_otel:
-        # Configure OpenTelemetry endpoint & headers
-        os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = f"{os.environ['LANGFUSE_HOST']}/api/public/otel"
-        os.environ["OTEL_EXPORTER_OTLP_HEADERS"] = f"Authorization=Basic {langfuse_auth}"
+        env.setdefault("OTEL_EXPORTER_OTLP_ENDPOINT", f"{host}/api/public/otel")
+        if "OTEL_EXPORTER_OTLP_HEADERS" not in env:
+            # Build Basic Auth header.
+            if public_key == config.public_key and secret_key == config.secret_key:
+                langfuse_auth = config.basic_auth
+            else:
+                langfuse_auth = base64.b64encode(f"{public_key}:{secret_key}".encode()).decode()
+            env["OTEL_EXPORTER_OTLP_HEADERS"] = f"Authorization=Basic {langfuse_auth}"
 
 
 def set_env_llm(config: LLMConfigSchema | None, prefix: str | None):
@@ -54,12 +58,14 @@ def set_env_llm(config: LLMConfigSchema | None, prefix: str | None):
         prefix = config.name.upper()
     up = prefix.upper()
 
-    os.environ[f"{up}_API_KEY"] = os.environ.get(f"{up}_API_KEY", config.api_key)
+    env = os.environ
+    env.setdefault(f"{up}_API_KEY", config.api_key)
     logger.info("Setting %s_API_KEY %s", up, len(config.api_key))
-    url = os.environ.get(f"{up}_API_BASE", config.url)
+    base_key = f"{up}_API_BASE"
+    url = env.get(base_key, config.url)
     if url:
         logger.info("Setting %s_API_BASE to %s", up, url)
-        os.environ[f"{up}_API_BASE"] = url
+        env[base_key] = url
 
 
 def init_envs_llm(config: ConfigSchema):
@@ -68,9 +74,11 @@ def init_envs_llm(config: ConfigSchema):
     set_env_llm(config.llms.openai, "OPENAI")
     set_env_llm(config.llms.gemini, "GEMINI")
     if config.llms.litellm_proxy and config.llms.litellm:
+        import litellm  # noqa: PLC0415
+
         logger.info("Using litellm proxy")
         litellm.use_litellm_proxy = True
-        os.environ["USE_LITELLM_PROXY"] = os.environ.get("USE_LITELLM_PROXY", "True")
+        os.environ.setdefault("USE_LITELLM_PROXY", "True")
     for name, conf in config.llms.llms.items():
         n = conf.name if conf.name else name
 
@@ -78,11 +86,20 @@ def init_envs_llm(config: ConfigSchema):
     set_tracing_export_api_key("")
 
 
+# Config whose LLM environment was last applied in this process
+_envs_config: ConfigSchema | None = None
+
+
 def init_envs(config: ConfigSchema):
     """
-    Initialize environment variables
+    Initialize environment variables, once per config object: re-running init with the same
+    config (tests, reloads) doesn't redo the env wiring.
     """
+    global _envs_config  # noqa: PLW0603
+    if config is _envs_config:
+        return
     init_envs_llm(config)
+    _envs_config = config
 
 
 def init_aliases(config: ConfigSchema):
@@ -90,10 +107,38 @@ def init_aliases(config: ConfigSchema):
     Aliases.add_aliases(config.aliases.root)
 
 
+def init_summary_cache(config: SummaryCacheConfigSchema):
+    from antgent.agents.summarizer.cache import SemanticSummaryCache, SummaryCache  # noqa: PLC0415
+    from antgent.agents.summarizer.summary import SummaryAgent  # noqa: PLC0415
+
+    if config.enabled:
+        logger.info("Enabling the summary cache: maxsize=%s ttl=%s", config.maxsize, config.ttl)
+        SummaryAgent.set_cache(SummaryCache(maxsize=config.maxsize, ttl=config.ttl))
+    else:
+        SummaryAgent.set_cache(None)
+
+    semantic = config.semantic
+    if semantic.enabled:
+        logger.info("Enabling the semantic summary cache: model=%s", semantic.embedding_model)
+        SummaryAgent.set_semantic_cache(
+            SemanticSummaryCache(
+                threshold=semantic.threshold,
+                maxsize=semantic.maxsize,
+                embedding_model=semantic.embedding_model,
+                project_name=semantic.project_name,
+                max_input_tokens=semantic.max_input_tokens,
+            )
+        )
+    else:
+        SummaryAgent.set_semantic_cache(None)
+
+
 def init_logfire(config: LogfireConfigSchema, mode: Literal["server", "worker"] = "server", extra=None):
     if not extra:
         extra = {}
     if config.send_to_logfire and config.token:
+        import logfire  # noqa: PLC0415
+
         logfire.configure(
             token=config.token, environment=extra.get("env", "dev"), send_to_logfire=config.send_to_logfire
         )
@@ -118,7 +163,11 @@ def init(
     BaseAgent.provider_config = config.model_providers
     init_aliases(config)
     init_envs(config)
+    init_summary_cache(config.summary_cache)
     set_trace_processors([])
     if config.traces.enabled:
         init_envs_langfuse(config.traces.langfuse, mode, extra)
         init_logfire(config.traces.logfire, mode, extra)
+    warmup_clients(config.llms)
+    if mode == "server":
+        preload_encoder()
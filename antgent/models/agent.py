@@ -1,10 +1,11 @@
+from dataclasses import dataclass
 from typing import Any, Literal, TypeVar
 
 from agents import (
     TResponseInputItem,
 )
 from agents.model_settings import ModelSettings
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field, RootModel
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, PrivateAttr, RootModel
 
 from antgent.agents.summarizer.models import SummariesResult, SummaryInput, SummaryOutput
 
@@ -19,6 +20,9 @@ TLLMInput = str | list[TResponseInputItem]
 TStructured = TypeVar("TStructured")
 
 
+_MAX_RESOLVED_MODELS = 256
+
+
 class ProviderSettings(BaseModel):
     """Provider-specific settings for a model."""
 
@@ -46,6 +50,50 @@ class ModelProvidersConfig(BaseModel):
         description="List of prefix-to-provider mappings",
     )
 
+    _prefix_trie: dict[str, Any] | None = PrivateAttr(default=None)
+    _resolved: dict[str, ProviderMapping | ProviderSettings] = PrivateAttr(default_factory=dict)
+
+    def _get_prefix_trie(self) -> dict[str, Any]:
+        """Char trie of the mapping prefixes, terminal nodes hold the mapping index under the "" key."""
+        if self._prefix_trie is None:
+            trie: dict[str, Any] = {}
+            for idx, mapping in enumerate(self.mappings):
+                node = trie
+                for char in mapping.prefix:
+                    node = node.setdefault(char, {})
+                node.setdefault("", idx)
+            self._prefix_trie = trie
+        return self._prefix_trie
+
+    def match_prefix(self, model_name: str) -> ProviderMapping | None:
+        """
+        Returns the mapping whose prefix matches model_name, walking the trie in O(len(model_name)).
+        When several prefixes match, the first one in `mappings` wins.
+        """
+        node = self._get_prefix_trie()
+        best: int | None = node.get("")
+        for char in model_name:
+            node = node.get(char)
+            if node is None:
+                break
+            idx = node.get("")
+            if idx is not None and (best is None or idx < best):
+                best = idx
+        return None if best is None else self.mappings[best]
+
+    def resolve(self, model_name: str) -> ProviderMapping | ProviderSettings:
+        """
+        Returns the client/api_mode settings for model_name: its matching mapping, else the default.
+        Memoized per model name, agents resolve the same handful of models over and over.
+        """
+        settings = self._resolved.get(model_name)
+        if settings is None:
+            if len(self._resolved) >= _MAX_RESOLVED_MODELS:
+                # Model names can come from per-run dynamic configs, keep the memo bounded
+                self._resolved.clear()
+            settings = self._resolved[model_name] = self.match_prefix(model_name) or self.default
+        return settings
+
 
 class ModelInfo(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
@@ -90,41 +138,58 @@ class AgentFrozenConfig[TOutput, TStructured](BaseModel):
     run_kwargs: dict[str, Any] = Field(
         default_factory=dict, description="Default kwargs to pass to Runner.run() (e.g., max_turns, result_type)"
     )
+    trusted_output: bool = Field(
+        default=False,
+        description=(
+            "Build the structured output with model_construct instead of validating it. Only for flat models "
+            "with a provider-enforced JSON schema."
+        ),
+    )
 
-    def get_structured_cls(self) -> type[TStructured] | None:
+    _structured_cls: type[TStructured] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, context: Any, /) -> None:
+        # The config is frozen: resolve the structured class once, invalid configs fail at definition
         if self.structured and self.structured_cls is None and self.output_cls is None:
             raise ValueError("If structured is True, structured_cls or output_cls must be provided")
-        if self.structured and self.structured_cls is None and self.output_cls is not None:
+        if self.structured and self.structured_cls is None:
             # If structured is True but structured_cls is None, use output_cls as structured_cls
-            return self.output_cls  # type: ignore[return-value]
-        return self.structured_cls
+            self._structured_cls = self.output_cls  # type: ignore[assignment]
+        else:
+            self._structured_cls = self.structured_cls
+
+    def get_structured_cls(self) -> type[TStructured] | None:
+        return self._structured_cls
 
 
 class AgentsConfigSchema(RootModel[dict[str, AgentConfig]]):
     root: dict[str, AgentConfig] = Field(default_factory=dict)
 
     def get(self, name: str) -> AgentConfig | None:
-        if name in self.root:
-            return self.root[name]
-        return None
+        return self.root.get(name)
+
+
+@dataclass(slots=True)
+class PrepareRun[TContext]:
+    """Runner-internal result of prep_input, never serialized: a plain slotted dataclass."""
 
+    llm_input: TLLMInput = ""
+    context: TContext | None = None
+    short_cut: bool = False
 
-class PrepareRun[TContext](BaseModel):
-    llm_input: TLLMInput = Field(default="")
-    context: TContext | None = Field(default=None)
-    short_cut: bool = Field(default=False)
 
+@dataclass(slots=True, frozen=True)
+class AgentRunMetadata:
+    """Tracing identifiers handed to an agent instance, never validated nor serialized."""
 
-class AgentRunMetadata(BaseModel):
-    trace_id: str | None = Field(default=None)
-    span_id: str | None = Field(default=None)
-    session_id: str | None = Field(default=None)
-    parent_name: str | None = Field(default=None)
+    trace_id: str | None = None
+    span_id: str | None = None
+    session_id: str | None = None
+    parent_name: str | None = None
 
 
 class LLMConfigSchema(BaseModel):
     model_config = ConfigDict(extra="allow", frozen=True)
-    model_config = ConfigDict(extra="allow")
     api_key: str = Field(default="antgent-openaiKEY")
     project_id: str = Field(default="proj-1xZoR")
     organization_id: str = Field(default="org-1xZoRaUM")
@@ -142,12 +207,24 @@ class LLMsConfigSchema(BaseModel):
     gemini: LLMConfigSchema | None = Field(default=None)
     llms: dict[str, LLMConfigSchema] = Field(default_factory=dict)
 
+    _projects: dict[str, LLMConfigSchema] = PrivateAttr(default_factory=dict)
+
     __hash__ = object.__hash__
 
+    def model_post_init(self, context: Any, /) -> None:
+        # Named projects (openai, gemini, extra keys...) take precedence over the `llms` dict
+        projects = dict(self.llms)
+        for name in type(self).model_fields:
+            value = getattr(self, name)
+            if isinstance(value, LLMConfigSchema):
+                projects[name] = value
+        for name, value in (self.model_extra or {}).items():
+            if value is not None:
+                projects[name] = value
+        self._projects = projects
+
     def get_project(self, name: str) -> LLMConfigSchema | None:
-        if hasattr(self, name) and getattr(self, name) is not None:
-            return getattr(self, name)
-        return self.llms.get(name, None)
+        return self._projects.get(name)
 
 
 class AgentRunCost(BaseModel):
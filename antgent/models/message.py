@@ -41,8 +41,8 @@ class Content(BaseModel):
         else:
             file_info = await dl_client.download(content_url, output=output)
 
-        output.seek(0)
-        file_bytes = output.read()
+        # Hands over the downloaded buffer without copying it
+        file_bytes = output.getvalue()
 
         if file_info.filename:
             self.title = self.title or file_info.filename
@@ -65,7 +65,6 @@ class Content(BaseModel):
     async def to_messages(
         self, role: Literal["user", "assistant", "developer", "system"] = "user", with_title: bool = True
     ) -> list[TResponseInputItem]:
-        res = []
         content_to_process = self.content
         mime_type = self.mime
         mode = self.mode
@@ -76,15 +75,17 @@ class Content(BaseModel):
         # Add title message after URL processing (title may be set from filename)
         if not self.title:
             self.title = "input_file"
-        if with_title and self.title:
-            res.insert(0, EasyInputMessageParam(role=role, content=f"## {self.title}:\n"))
+        res: list[TResponseInputItem] = (
+            [EasyInputMessageParam(role=role, content=f"## {self.title}:\n")] if with_title else []
+        )
 
         if mode == "string":
             res.append(EasyInputMessageParam(role=role, content=str(content_to_process) + "\n"))
         else:
             content_b64 = ""
             if mode == "bytes" and isinstance(content_to_process, bytes):
-                content_b64 = base64.b64encode(content_to_process).decode("utf-8")
+                # base64 output is pure ASCII: skip the UTF-8 decoder, encode straight from the buffer
+                content_b64 = base64.b64encode(memoryview(content_to_process)).decode("ascii")
             elif mode == "b64" and isinstance(content_to_process, str):
                 content_b64 = content_to_process
 
@@ -93,7 +94,9 @@ class Content(BaseModel):
                     role=role,
                     content=[
                         ResponseInputFileParam(
-                            type="input_file", file_data=f"data:{mime_type};base64,{content_b64}", filename=self.title
+                            type="input_file",
+                            file_data="".join(("data:", mime_type, ";base64,", content_b64)),
+                            filename=self.title,
                         )
                     ],
                 )
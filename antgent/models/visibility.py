@@ -1,8 +1,10 @@
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
 from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class WorkflowStepStatus(StrEnum):
@@ -20,22 +22,34 @@ class WorkflowStepStatus(StrEnum):
 
 
 class WorkflowInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
     name: str = Field(default="", description="The name of the agent workflow to run")
     wid: str = Field(default="", description="The ID of the agent workflow to run")
     run_id: str = Field(default="", description="The ID of the agent workflow run")
     namespace: str = Field(default="", description="The namespace of the agent workflow run")
 
+    @field_validator("name", "namespace")
+    @classmethod
+    def _intern(cls, value: str) -> str:
+        # Few distinct workflow names/namespaces shared by every run: keep one copy of each
+        return sys.intern(value)
 
-class WorkflowStep(BaseModel):
-    """Represents a single step in a workflow execution graph."""
 
-    id: str = Field(default="")
-    name: str = Field(default="", description="The name of the workflow step")
-    status: WorkflowStepStatus = Field(default=WorkflowStepStatus.PENDING)
+@dataclass(slots=True)
+class WorkflowStep:
+    """
+    Represents a single step in a workflow execution graph.
+    Built programmatically while tracking, a slotted dataclass: pydantic still validates and
+    serializes it as part of Visibility.
+    """
+
+    id: str = ""
+    name: str = ""  # The name of the workflow step
+    status: WorkflowStepStatus = WorkflowStepStatus.PENDING
     start_time: datetime | None = None
     end_time: datetime | None = None
-    children: list["WorkflowStep"] = Field(default_factory=list)
-    metadata: dict[str, str] = Field(default_factory=dict)
+    children: list["WorkflowStep"] = field(default_factory=list)
+    metadata: dict[str, str] = field(default_factory=dict)
 
 
 class Visibility(BaseModel):
@@ -1,13 +1,14 @@
 # pylint: disable=no-name-in-module
 # pylint: disable=no-self-argument
 # pylint: disable=too-few-public-methods
+import asyncio
 import logging
 
 import temporalio.client
 from ant31box.server.exception import ResourceNotFound
 from fastapi import APIRouter
 
-from antgent.models.job import AsyncResponse
+from antgent.models.job import AsyncResponse, Job
 from antgent.temporal.utils import get_handler
 
 router = APIRouter(prefix="/api/job", tags=["antgent", "status"])
@@ -23,22 +24,22 @@ async def status(ar: AsyncResponse, with_result: bool = False) -> AsyncResponse:
     :param ar: The AsyncResponse object containing the job details.
     :return: The updated AsyncResponse object with the workflow status and result.
     """
-    for job in ar.payload.jobs:
-        workflow_id = job.uuid
-        handler, _ = await get_handler(workflow_id=job.uuid, workflow_name=job.name)
+    # The signature doesn't depend on the job, check it once
+    include_result = bool(with_result and ar.secret_key and ar.check_signature())
+
+    async def _update_job(j: Job) -> None:
+        workflow_id = j.uuid
+        handler, _ = await get_handler(workflow_id=j.uuid, workflow_name=j.name)
         describe = await handler.describe()
-        j = job
         if not describe.status:
             raise ResourceNotFound("Workflow not found", {"message": "Workflow not found", "workflow_id": workflow_id})
         j.status = describe.status.name
         ## Don't include result. Add new endpoint for result if needed
-        if (
-            describe.status == temporalio.client.WorkflowExecutionStatus.COMPLETED
-            and with_result
-            and ar.secret_key
-            and ar.check_signature()
-        ):
+        if include_result and describe.status == temporalio.client.WorkflowExecutionStatus.COMPLETED:
             j.result = await handler.result()
 
+    # One describe RPC per job, run concurrently
+    await asyncio.gather(*(_update_job(job) for job in ar.payload.jobs))
+
     ar.gen_signature()
     return ar
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+
+from antgent.server.api import job_info, status
+from antgent.server.api.workflows import list as workflows_list
+from antgent.server.api.workflows import summarizer
+
+# All antgent API routes, registered on the app through a single entry
+api_router = APIRouter()
+api_router.include_router(job_info.router)
+api_router.include_router(workflows_list.router)
+api_router.include_router(summarizer.router)
+api_router.include_router(status.router)
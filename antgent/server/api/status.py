@@ -2,10 +2,11 @@ import logging
 from typing import Annotated
 
 import temporalio.client
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
 from temporalio.client import Client
 
+from antgent.server.responses import PydanticJSONResponse
 from antgent.temporal.client import tclient
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,7 @@ async def get_workflow_status(workflow_id: str, client: Client) -> dict:
     try:
         progress = await handle.query("get_progress")
         if isinstance(progress, BaseModel):
-            response_data = progress.model_dump(mode="json")
+            response_data = progress.model_dump()
         elif isinstance(progress, dict):
             response_data = progress
         else:
@@ -67,7 +68,7 @@ async def get_workflow_status(workflow_id: str, client: Client) -> dict:
 router = APIRouter(prefix="/api/workflows", tags=["Workflows"])
 
 
-@router.get("/status/{workflow_id}")
-async def workflow_status(workflow_id: str, client: Annotated[Client, Depends(tclient)]) -> dict:
+@router.get("/status/{workflow_id}", response_class=PydanticJSONResponse)
+async def workflow_status(workflow_id: str, client: Annotated[Client, Depends(tclient)]) -> Response:
     """Polls for the status and results of any workflow execution."""
-    return await get_workflow_status(workflow_id, client)
+    return PydanticJSONResponse(await get_workflow_status(workflow_id, client))
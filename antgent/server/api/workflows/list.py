@@ -1,11 +1,15 @@
 import logging
-from typing import Annotated
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import Annotated, Literal
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 from temporalio.client import Client, WorkflowExecution
 from temporalio.common import SearchAttributeKey
 
-from antgent.config import ConfigSchema, config
+from antgent.config import Config, ConfigSchema, config
 from antgent.temporal.client import tclient
 
 router = APIRouter(prefix="/api", tags=["Workflows"])
@@ -14,11 +18,25 @@ logger = logging.getLogger(__name__)
 
 def get_workflow_types_from_config() -> list[str]:
     """Get workflow type names from config, ensuring defaults are included."""
+    return sorted(_workflow_types(config()))
+
+
+_workflow_types_cache: tuple[Config, frozenset[str]] | None = None
+
+
+def _workflow_types(conf: Config) -> frozenset[str]:
+    """Workflow type names, collected once per loaded configuration (a reload creates a new Config)."""
+    global _workflow_types_cache  # noqa: PLW0603
+    if _workflow_types_cache is None or _workflow_types_cache[0] is not conf:
+        _workflow_types_cache = (conf, _collect_workflow_types(conf))
+    return _workflow_types_cache[1]
+
+
+def _collect_workflow_types(conf: Config) -> frozenset[str]:
     workflow_types = set()
 
     # 1. Get from loaded configuration which might override the defaults.
-    worker_configs = config().workers
-    for worker_config in worker_configs:
+    for worker_config in conf.workers:
         for workflow in worker_config.workflows:
             workflow_types.add(workflow.split(":")[-1])
 
@@ -30,7 +48,7 @@ def get_workflow_types_from_config() -> list[str]:
             for workflow in worker_config.workflows:
                 workflow_types.add(workflow.split(":")[-1])
 
-    return sorted(workflow_types)
+    return frozenset(workflow_types)
 
 
 @router.get("/workflows/types", response_model=list[str], summary="List all discoverable workflow types.")
@@ -39,49 +57,71 @@ async def list_workflow_types():
     return get_workflow_types_from_config()
 
 
+def _get_processed_values(param: str | None) -> list[str]:
+    if not param:
+        return []
+    return [v for v in map(str.strip, param.split(",")) if v]
+
+
 def _build_list_workflows_query(
     workflow_type: str | None,
     case_id: str | None,
     status: str | None,
     original_workflow_id: str | None,
 ) -> str:
-    query_parts = []
+    # Dashboards poll with the same filters: memoized, keyed on the valid types so a config reload misses
+    valid_types = _workflow_types(config()) if workflow_type else frozenset()
+    return _cached_list_workflows_query(workflow_type, case_id, status, original_workflow_id, valid_types)
 
-    def _get_processed_values(param: str | None) -> list[str]:
-        if not param:
-            return []
-        return [v.strip() for v in param.split(",") if v.strip()]
 
+# Values are single-quoted in the visibility query, quotes inside them are doubled
+_QUOTE_ESCAPE = str.maketrans({"'": "''"})
+
+
+def _in_clause(field: str, values: list[str]) -> str:
+    return f"{field} IN ('" + "', '".join(v.translate(_QUOTE_ESCAPE) for v in values) + "')"
+
+
+@lru_cache(maxsize=256)
+def _cached_list_workflows_query(
+    workflow_type: str | None,
+    case_id: str | None,
+    status: str | None,
+    original_workflow_id: str | None,
+    valid_types: frozenset[str],
+) -> str:
     processed_types = _get_processed_values(workflow_type)
     if processed_types:
-        valid_types = get_workflow_types_from_config()
-        for wt in processed_types:
-            if wt not in valid_types:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid workflow type '{wt}'. Valid types are: {', '.join(valid_types)}",
-                )
-        types_str = "', '".join(processed_types)
-        query_parts.append(f"WorkflowType IN ('{types_str}')")
-
-    processed_case_ids = _get_processed_values(case_id)
-    if processed_case_ids:
-        case_ids_str = "', '".join(processed_case_ids)
-        query_parts.append(f"CaseId IN ('{case_ids_str}')")
-
-    processed_original_ids = _get_processed_values(original_workflow_id)
-    if processed_original_ids:
-        original_ids_str = "', '".join(processed_original_ids)
-        query_parts.append(f"OriginalWorkflowId IN ('{original_ids_str}')")
-
-    processed_statuses = _get_processed_values(status)
-    if processed_statuses:
-        # Values for ExecutionStatus are capitalized: Running, Completed, etc.
-        statuses = [s.capitalize() for s in processed_statuses]
-        statuses_str = "', '".join(statuses)
-        query_parts.append(f"ExecutionStatus IN ('{statuses_str}')")
-
-    return " AND ".join(query_parts)
+        invalid = set(processed_types).difference(valid_types)
+        if invalid:
+            invalid_str = ", ".join(sorted(invalid))
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid workflow type '{invalid_str}'. Valid types are: {', '.join(sorted(valid_types))}",
+            )
+
+    # Values for ExecutionStatus are capitalized: Running, Completed, etc.
+    filters = (
+        ("WorkflowType", processed_types),
+        ("CaseId", _get_processed_values(case_id)),
+        ("OriginalWorkflowId", _get_processed_values(original_workflow_id)),
+        ("ExecutionStatus", [s.capitalize() for s in _get_processed_values(status)]),
+    )
+    return " AND ".join(_in_clause(field, values) for field, values in filters if values)
+
+
+DEFAULT_LIST_LIMIT = 50
+MAX_LIST_LIMIT = 500
+# Temporal stops fetching pages once the limit is reached, small pages avoid over-fetching the last one
+MAX_PAGE_SIZE = 100
+
+
+def _page_size(limit: int) -> int:
+    return min(limit, MAX_PAGE_SIZE)
+
+
+# Untyped keys are immutable and looked up by name, one per search attribute name is enough
+_SEARCH_ATTRIBUTE_KEYS: dict[str, SearchAttributeKey] = {}
 
 
 def _process_workflow_execution(w: WorkflowExecution) -> dict:
@@ -95,11 +135,14 @@ def _process_workflow_execution(w: WorkflowExecution) -> dict:
 
     search_attributes = {}
     if w.search_attributes:
+        typed = w.typed_search_attributes
         for key_str in w.search_attributes:
+            key = _SEARCH_ATTRIBUTE_KEYS.get(key_str)
+            if key is None:
+                key = _SEARCH_ATTRIBUTE_KEYS[key_str] = SearchAttributeKey.for_untyped(key_str)
             try:
                 # Use untyped key to get value, letting the SDK handle decoding
-                value = w.typed_search_attributes.get(SearchAttributeKey.for_untyped(key_str))
-                search_attributes[key_str] = value
+                search_attributes[key_str] = typed.get(key)
             except Exception:
                 search_attributes[key_str] = "Error decoding search attribute"
 
@@ -115,8 +158,26 @@ def _process_workflow_execution(w: WorkflowExecution) -> dict:
     }
 
 
+LIST_ERROR = "Failed to list workflows from Temporal."
+
+
+async def _stream_workflows(client: Client, query: str, limit: int) -> AsyncIterator[bytes]:
+    """
+    NDJSON lines of the executions matching query, without holding the full list in memory.
+    On a Temporal error the stream ends with an {"error": ...} line: the 200 status is already sent.
+    """
+    logger.info("Streaming workflows with query: '%s'", query)
+    try:
+        async for w in client.list_workflows(query=query, limit=limit, page_size=_page_size(limit)):
+            yield to_json(_process_workflow_execution(w)) + b"\n"
+    except Exception as e:
+        logger.error("Error streaming workflows from Temporal with query '%s': %s", query, e, exc_info=True)
+        yield to_json({"error": LIST_ERROR}) + b"\n"
+
+
 @router.get("/workflows", response_model=list[dict], summary="List workflow executions.")
 async def list_workflows(
+    *,
     workflow_type: Annotated[
         str | None,
         Query(alias="type", description="Filter by one or more workflow type names (comma-separated)."),
@@ -133,18 +194,39 @@ async def list_workflows(
         str | None,
         Query(alias="OriginalWorkflowId", description="Filter by OriginalWorkflowId search attribute."),
     ] = None,
+    output_format: Annotated[
+        Literal["array", "ndjson"],
+        Query(
+            alias="format",
+            description=(
+                "'array' returns a JSON array, 'ndjson' streams one JSON object per line as Temporal pages in. "
+                'A failed ndjson listing ends with an {"error": ...} line instead of a 500.'
+            ),
+        ),
+    ] = "array",
+    limit: Annotated[
+        int,
+        Query(ge=1, le=MAX_LIST_LIMIT, description="Maximum number of workflow executions to return."),
+    ] = DEFAULT_LIST_LIMIT,
 ):
-    """Lists workflow executions, with optional filters for type, status, and case ID."""
+    """
+    Lists workflow executions, with optional filters for type, status, and case ID.
+    With format=ndjson a Temporal failure can happen once the stream started: the last line is then
+    {"error": "..."} instead of an execution.
+    """
     client: Client = await tclient()
     query = _build_list_workflows_query(workflow_type, case_id, status, original_workflow_id)
 
+    if output_format == "ndjson":
+        return StreamingResponse(_stream_workflows(client, query, limit), media_type="application/x-ndjson")
+
     workflows = []
     logger.info(f"Listing workflows with query: '{query}'")
     try:
-        async for w in client.list_workflows(query=query):
+        async for w in client.list_workflows(query=query, limit=limit, page_size=_page_size(limit)):
             workflows.append(_process_workflow_execution(w))
     except Exception as e:
         logger.error(f"Error listing workflows from Temporal with query '{query}': {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Failed to list workflows from Temporal.") from e
+        raise HTTPException(status_code=500, detail=LIST_ERROR) from e
 
     return workflows
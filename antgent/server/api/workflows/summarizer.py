@@ -1,11 +1,11 @@
 import asyncio
 import logging
-import uuid
+import secrets
 from datetime import timedelta
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from temporalio.client import Client
+from fastapi import APIRouter, Depends, HTTPException, Response
+from temporalio.client import Client, WorkflowHandle
 
 from antgent.agents.summarizer.models import SummariesResult, SummaryInput, SummaryOutput
 from antgent.models.agent import (
@@ -14,6 +14,7 @@ from antgent.models.agent import (
 )
 from antgent.models.visibility import WorkflowInfo
 from antgent.server.api.status import get_workflow_status
+from antgent.server.responses import PydanticJSONResponse
 from antgent.temporal.client import tclient
 from antgent.temporal.queue_manager import get_workflow_queue
 from antgent.workflows.base import WorkflowInput
@@ -27,21 +28,30 @@ router = APIRouter(prefix="/api/workflows", tags=["Summarizer"])
 logger = logging.getLogger(__name__)
 
 
+async def _start_workflow(
+    client: Client,
+    workflow_cls: type[TextSummarizerOneTypeWorkflow] | type[TextSummarizerAllWorkflow],
+    ctx: WorkflowInput[SummaryInput],
+    prefix: str,
+) -> tuple[str, WorkflowHandle[Any, Any]]:
+    """Mints the workflow id, tags the input with it and starts the workflow on the workflows queue."""
+    workflow_id = f"{prefix}-{secrets.token_hex(16)}"
+    ctx.wid = WorkflowInfo(wid=workflow_id, name=workflow_cls.__name__)
+    handle = await client.start_workflow(
+        workflow_cls.run,
+        ctx,
+        id=workflow_id,
+        task_queue=get_workflow_queue(),
+    )
+    return workflow_id, handle
+
+
 @router.post("/summarizer/sync", tags=["sync"])
 async def text_summarize(
     ctx: WorkflowInput[SummaryInput], client: Annotated[Client, Depends(tclient)]
 ) -> AgentTextSummaryWorkflowOutput:
     """Executes a single-type summarization workflow and waits for the result."""
-    workflow_id = f"summarizer-one-type-sync-{uuid.uuid4().hex}"
-    ctx.wid = WorkflowInfo(wid=workflow_id, name=TextSummarizerOneTypeWorkflow.__name__)
-    queue = get_workflow_queue()
-
-    handle = await client.start_workflow(
-        TextSummarizerOneTypeWorkflow.run,
-        ctx,
-        id=workflow_id,
-        task_queue=queue,
-    )
+    workflow_id, handle = await _start_workflow(client, TextSummarizerOneTypeWorkflow, ctx, "summarizer-one-type-sync")
     try:
         timeout_seconds = timedelta(minutes=5).total_seconds()
         result_output = await asyncio.wait_for(handle.result(), timeout=timeout_seconds)
@@ -77,16 +87,7 @@ async def text_summarize_all(
         logger.warning("Maximum iterations is reduced to 3")
         ctx.agent_input.context.iterations = 3
 
-    workflow_id = f"summarizer-all-sync-{uuid.uuid4().hex}"
-    ctx.wid = WorkflowInfo(wid=workflow_id, name=TextSummarizerAllWorkflow.__name__)
-    queue = get_workflow_queue()
-
-    handle = await client.start_workflow(
-        TextSummarizerAllWorkflow.run,
-        ctx,
-        id=workflow_id,
-        task_queue=queue,
-    )
+    workflow_id, handle = await _start_workflow(client, TextSummarizerAllWorkflow, ctx, "summarizer-all-sync")
     try:
         timeout_seconds = timedelta(minutes=10).total_seconds()
         result_output = await asyncio.wait_for(handle.result(), timeout=timeout_seconds)
@@ -122,22 +123,14 @@ async def run_summarizer_one_type(
     ctx: WorkflowInput[SummaryInput], client: Annotated[Client, Depends(tclient)]
 ) -> dict[str, str]:
     """Starts a text summarizer workflow for a single type and returns the workflow ID."""
-    workflow_id = f"summarizer-one-type-{uuid.uuid4().hex}"
-    ctx.wid = WorkflowInfo(wid=workflow_id, name=TextSummarizerOneTypeWorkflow.__name__)
-    queue = get_workflow_queue()
-    await client.start_workflow(
-        TextSummarizerOneTypeWorkflow.run,
-        ctx,
-        id=workflow_id,
-        task_queue=queue,
-    )
+    workflow_id, _ = await _start_workflow(client, TextSummarizerOneTypeWorkflow, ctx, "summarizer-one-type")
     return {"workflow_id": workflow_id}
 
 
-@router.get("/summarizer/{workflow_id}/status", tags=["async"])
-async def summarizer_one_type_status(workflow_id: str, client: Annotated[Client, Depends(tclient)]) -> dict:
+@router.get("/summarizer/{workflow_id}/status", tags=["async"], response_class=PydanticJSONResponse)
+async def summarizer_one_type_status(workflow_id: str, client: Annotated[Client, Depends(tclient)]) -> Response:
     """Polls for the status and results of a TextSummarizerOneTypeWorkflow execution."""
-    return await get_workflow_status(workflow_id, client)
+    return PydanticJSONResponse(await get_workflow_status(workflow_id, client))
 
 
 @router.post("/summarizer/retrigger_async", tags=["async"])
@@ -145,15 +138,7 @@ async def summarizer_one_type_retrigger(
     ctx: WorkflowInput[SummaryInput], client: Annotated[Client, Depends(tclient)]
 ) -> dict[str, str]:
     """Retriggers a TextSummarizerOneTypeWorkflow with the same input and returns the new workflow_id."""
-    workflow_id = f"summarizer-one-type-{uuid.uuid4().hex}"
-    ctx.wid = WorkflowInfo(wid=workflow_id, name=TextSummarizerOneTypeWorkflow.__name__)
-    queue = get_workflow_queue()
-    await client.start_workflow(
-        TextSummarizerOneTypeWorkflow.run,
-        ctx,
-        id=workflow_id,
-        task_queue=queue,
-    )
+    workflow_id, _ = await _start_workflow(client, TextSummarizerOneTypeWorkflow, ctx, "summarizer-one-type")
     return {"workflow_id": workflow_id}
 
 
@@ -162,22 +147,14 @@ async def run_summarizer_all(
     ctx: WorkflowInput[SummaryInput], client: Annotated[Client, Depends(tclient)]
 ) -> dict[str, str]:
     """Starts a text summarizer workflow for all types and returns the workflow ID."""
-    workflow_id = f"summarizer-all-{uuid.uuid4().hex}"
-    ctx.wid = WorkflowInfo(wid=workflow_id, name=TextSummarizerAllWorkflow.__name__)
-    queue = get_workflow_queue()
-    await client.start_workflow(
-        TextSummarizerAllWorkflow.run,
-        ctx,
-        id=workflow_id,
-        task_queue=queue,
-    )
+    workflow_id, _ = await _start_workflow(client, TextSummarizerAllWorkflow, ctx, "summarizer-all")
     return {"workflow_id": workflow_id}
 
 
-@router.get("/summarizer-all/{workflow_id}/status", tags=["async"])
-async def summarizer_all_status(workflow_id: str, client: Annotated[Client, Depends(tclient)]) -> dict:
+@router.get("/summarizer-all/{workflow_id}/status", tags=["async"], response_class=PydanticJSONResponse)
+async def summarizer_all_status(workflow_id: str, client: Annotated[Client, Depends(tclient)]) -> Response:
     """Polls for the status and results of a TextSummarizerAllWorkflow execution."""
-    return await get_workflow_status(workflow_id, client)
+    return PydanticJSONResponse(await get_workflow_status(workflow_id, client))
 
 
 @router.post("/summarizer-all/retrigger_async", tags=["async"])
@@ -185,13 +162,5 @@ async def summarizer_all_retrigger(
     ctx: WorkflowInput[SummaryInput], client: Annotated[Client, Depends(tclient)]
 ) -> dict[str, str]:
     """Retriggers a TextSummarizerAllWorkflow with the same input and returns the new workflow_id."""
-    workflow_id = f"summarizer-all-{uuid.uuid4().hex}"
-    ctx.wid = WorkflowInfo(wid=workflow_id, name=TextSummarizerAllWorkflow.__name__)
-    queue = get_workflow_queue()
-    await client.start_workflow(
-        TextSummarizerAllWorkflow.run,
-        ctx,
-        id=workflow_id,
-        task_queue=queue,
-    )
+    workflow_id, _ = await _start_workflow(client, TextSummarizerAllWorkflow, ctx, "summarizer-all")
     return {"workflow_id": workflow_id}
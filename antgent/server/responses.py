@@ -0,0 +1,15 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core in one pass: models, datetimes and enums are serialized
+    directly, without jsonable_encoder / model_dump(mode="json") round-trips. Values pydantic-core
+    can't serialize raise instead of being rendered as their str().
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -7,12 +7,7 @@ from antgent.config import config
 
 
 class AntgentServer(Server):
-    _routers: ClassVar[set[str]] = {
-        "antgent.server.api.job_info:router",
-        "antgent.server.api.workflows.list:router",
-        "antgent.server.api.workflows.summarizer:router",
-        "antgent.server.api.status:router",
-    }
+    _routers: ClassVar[set[str]] = {"antgent.server.api.routes:api_router"}
     _middlewares: ClassVar[set[str]] = {"tokenAuth"}
 
 
@@ -1,8 +1,11 @@
+import asyncio
 import hashlib
 import io
 import logging
 import mimetypes
-import uuid
+import secrets
+import time
+from collections.abc import Awaitable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,6 +19,15 @@ from antgent.utils.pdf import text_to_pdf
 
 logger = logging.getLogger(__name__)
 
+# Max uploads of a single request in flight at once
+UPLOAD_CONCURRENCY = 8
+HASH_CHUNK_SIZE = 1024 * 1024
+# Starlette keeps uploads up to 1 MiB in memory before spooling them to disk
+SMALL_FILE_SIZE = 1024 * 1024
+# Content fingerprint used as a dedup suffix of the S3 folder, not a security primitive:
+# 4-byte blake2b (8 hex chars), faster than sha256 in hashlib
+FINGERPRINT_SIZE = 4
+
 
 def _process_docx_file(file_bytes: bytes, filename: str) -> tuple[bytes, str, str, io.BytesIO]:
     """Process DOCX file: extract text, convert to PDF."""
@@ -25,17 +37,46 @@ def _process_docx_file(file_bytes: bytes, filename: str) -> tuple[bytes, str, st
     return content, new_name, "application/pdf", io.BytesIO(content)
 
 
-def _process_other_file(
-    file_bytes: bytes, filename: str, content_type: str | None, ufile
-) -> tuple[bytes, str, str, Any]:
-    """Process non-DOCX files."""
+def _process_other_file(filename: str, content_type: str | None, ufile) -> tuple[str, str, Any]:
+    """Process non-DOCX files, uploaded as-is from the spooled upload file."""
     mime = content_type
     if not mime or mime == "application/octet-stream":
         guessed_mime, _ = mimetypes.guess_type(filename)
         if guessed_mime:
             mime = guessed_mime
     mime = mime or "application/octet-stream"
-    return file_bytes, filename, mime, ufile.file
+    return filename, mime, ufile.file
+
+
+def _hash_fileobj(fileobj) -> str:
+    """Content fingerprint of a file object read in chunks, rewound afterwards for the upload."""
+    h = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+    fileobj.seek(0)
+    while chunk := fileobj.read(HASH_CHUNK_SIZE):
+        h.update(chunk)
+    fileobj.seek(0)
+    return h.hexdigest()
+
+
+_YEAR_MONTH_TTL = 60.0
+_year_month: tuple[float, str] = (0.0, "")  # (expires at, value)
+
+
+def _current_year_month() -> str:
+    """Current "%Y-%m" upload folder, formatted at most once a minute."""
+    global _year_month  # noqa: PLW0603
+    expires, value = _year_month
+    now = time.monotonic()
+    if now >= expires:
+        value = datetime.now().strftime("%Y-%m")
+        _year_month = (now + _YEAR_MONTH_TTL, value)
+    return value
+
+
+def clear_year_month_cache() -> None:
+    """Forget the cached upload folder, the next upload formats it again."""
+    global _year_month  # noqa: PLW0603
+    _year_month = (0.0, "")
 
 
 def _build_dest_path(s3_prefix: str, year_month: str, filename: str, content_hash: str) -> str:
@@ -47,19 +88,27 @@ def _build_dest_path(s3_prefix: str, year_month: str, filename: str, content_has
 
 async def _process_and_upload_file(ufile: UploadFile, s3, year_month: str) -> Content:
     """Process a single file and upload to S3."""
-    file_bytes = await ufile.read()
-    await ufile.seek(0)
-
     filename = ufile.filename
     if not filename:
         filename = "unknown_file"
 
     if filename.lower().endswith(".docx"):
-        content, new_name, mime, file_io = _process_docx_file(file_bytes, filename)
+        # The conversion needs the whole document in memory. Only the converted PDF is uploaded,
+        # the upload file isn't read again and needs no rewind
+        file_bytes = await ufile.read()
+        # Text extraction and PDF rendering are CPU-bound, keep them off the event loop
+        content, new_name, mime, file_io = await asyncio.to_thread(_process_docx_file, file_bytes, filename)
+        file_hash = hashlib.blake2b(content, digest_size=FINGERPRINT_SIZE).hexdigest()
     else:
-        content, new_name, mime, file_io = _process_other_file(file_bytes, filename, ufile.content_type, ufile)
+        # Other files are hashed and uploaded from the spooled file, never fully loaded in memory
+        new_name, mime, file_io = _process_other_file(filename, ufile.content_type, ufile)
+        if isinstance(ufile.size, int) and ufile.size <= SMALL_FILE_SIZE:
+            # Still in memory (below Starlette's spool threshold), cheaper than a thread hop
+            file_hash = _hash_fileobj(file_io)
+        else:
+            # hashlib releases the GIL on large buffers: concurrent uploads hash in parallel threads
+            file_hash = await asyncio.to_thread(_hash_fileobj, file_io)
 
-    file_hash = hashlib.sha256(content).hexdigest()[:8]
     dest_path = _build_dest_path(s3.prefix, year_month, new_name, file_hash)
     s3_dest = await s3.upload_file_async(file_io, dest=dest_path)
     return Content(mode="url", content=s3_dest.url, mime=mime, title=new_name)
@@ -68,8 +117,8 @@ async def _process_and_upload_file(ufile: UploadFile, s3, year_month: str) -> Co
 async def _process_and_upload_text(text: str, s3, year_month: str) -> Content:
     """Process a single text and upload to S3."""
     text_bytes = text.encode("utf-8")
-    filename = f"text-input-{uuid.uuid4().hex}.txt"
-    text_hash = hashlib.sha256(text_bytes).hexdigest()[:8]
+    filename = f"text-input-{secrets.token_hex(8)}.txt"
+    text_hash = hashlib.blake2b(text_bytes, digest_size=FINGERPRINT_SIZE).hexdigest()
     dest_path = _build_dest_path(s3.prefix, year_month, filename, text_hash)
     s3_dest = await s3.upload_file_async(io.BytesIO(text_bytes), dest=dest_path)
     return Content(mode="url", content=s3_dest.url, mime="text/plain", title=filename)
@@ -79,16 +128,20 @@ async def prep_contents(
     texts: list[str] | None, files: list[UploadFile | None] | list[UploadFile] | None
 ) -> list[Content]:
     """Prepares text and file uploads into a list of Content objects, uploading files to S3."""
-    documents = []
-    s3 = s3_client()
-    year_month = datetime.now().strftime("%Y-%m")
+    valid_files = [ufile for ufile in files or [] if ufile and ufile.filename]
+    valid_texts = [text for text in texts or [] if text]
+    if not valid_files and not valid_texts:
+        return []
 
-    for ufile in files or []:
-        if ufile and ufile.filename:
-            documents.append(await _process_and_upload_file(ufile, s3, year_month))
+    s3 = s3_client()
+    year_month = _current_year_month()
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
 
-    for text in texts or []:
-        if text:
-            documents.append(await _process_and_upload_text(text, s3, year_month))
+    async def bounded(upload: Awaitable[Content]) -> Content:
+        async with semaphore:
+            return await upload
 
-    return documents
+    # Uploads run concurrently, gather keeps the input order (files first, then texts)
+    uploads = [_process_and_upload_file(ufile, s3, year_month) for ufile in valid_files]
+    uploads += [_process_and_upload_text(text, s3, year_month) for text in valid_texts]
+    return list(await asyncio.gather(*(bounded(upload) for upload in uploads)))
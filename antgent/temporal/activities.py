@@ -13,12 +13,12 @@ async def get_agent_configs() -> dict[str, AgentConfig]:
 @activity.defn
 def echo(message: str) -> str:
     """A simple echo activity."""
-    activity.logger.info(f"Echoing message: {message}")
+    activity.logger.info("Echoing message: %s", message)
     return f"Echo: {message}"
 
 
 @activity.defn
 async def aecho(message: str) -> str:
     """A simple async echo activity."""
-    activity.logger.info(f"Async echoing message: {message}")
+    activity.logger.info("Async echoing message: %s", message)
     return f"Async echo: {message}"
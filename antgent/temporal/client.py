@@ -1,4 +1,4 @@
-from functools import lru_cache
+from typing import Any
 
 from temporalio.client import Client
 
@@ -6,6 +6,13 @@ from antgent.config import TemporalCustomConfigSchema, config
 from antgent.utils.importpy import import_from_string
 
 
+def _data_converter(converter: str | None) -> Any:
+    """The data converter can be an import string, import_from_string caches the resolved object."""
+    if converter:
+        return import_from_string(converter)
+    return None
+
+
 class TClientSingleton:
     _client: Client | None = None
 
@@ -17,17 +24,10 @@ class TClientSingleton:
         if conf is None:
             conf = config().temporalio
 
-        # The data converter can be a string, so we need to import it.
-        @lru_cache(maxsize=1)
-        def get_data_converter():
-            if conf.converter:
-                return import_from_string(conf.converter)
-            return None
-
         self._client = await Client.connect(
             conf.host,
             namespace=conf.namespace,
-            data_converter=get_data_converter(),
+            data_converter=_data_converter(conf.converter),
         )
         return self._client
 
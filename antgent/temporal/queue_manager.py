@@ -1,9 +1,11 @@
 import logging
 
-from antgent.config import config
+from antgent.config import Config, config
 
 logger = logging.getLogger(__name__)
 
+_queue_cache: tuple[Config, str] | None = None
+
 
 def get_workflow_queue() -> str:
     """
@@ -12,7 +14,16 @@ def get_workflow_queue() -> str:
     It finds the first worker with workflows defined in its configuration.
     If no worker has workflows, it falls back to the first worker's queue.
     """
-    workers = config().workers
+    global _queue_cache  # noqa: PLW0603
+    conf = config()
+    # Resolved once per loaded configuration, a reload creates a new Config
+    if _queue_cache is None or _queue_cache[0] is not conf:
+        _queue_cache = (conf, _resolve_workflow_queue(conf))
+    return _queue_cache[1]
+
+
+def _resolve_workflow_queue(conf: Config) -> str:
+    workers = conf.workers
     for worker in workers:
         if worker.workflows:
             return worker.queue
@@ -56,7 +56,6 @@ async def is_workflow_running(handler: WorkflowHandlerType) -> bool:
             # raise exc
         logger.debug("Not running: Workflow not found: %s", handler.id)
         return False
-    describe = await handler.describe()
     if describe.status != temporalio.client.WorkflowExecutionStatus.RUNNING:
         logger.debug("Not running: Workflow found: %s (%s)", handler.id, describe.status)
         return False
@@ -71,6 +70,7 @@ async def wait_for_result(
     root_key: str | None = None,
 ) -> Job:
     results = {}
+    status = None
     if wait:
         try:
             res = await asyncio.wait_for(handler.result(rpc_timeout=timedelta(seconds=timeout)), timeout=timeout)
@@ -78,11 +78,12 @@ async def wait_for_result(
                 results[root_key] = res.model_dump()
             else:
                 results = res.model_dump()
+            # result() only returns for a completed workflow, no need to describe it
+            status = temporalio.client.WorkflowExecutionStatus.COMPLETED.name
         except TimeoutError:
             pass
-    status = "UNKNOWN"
-    workflow_status = (await handler.describe()).status
-    if workflow_status is not None:
-        status = workflow_status.name
+    if status is None:
+        workflow_status = (await handler.describe()).status
+        status = "UNKNOWN" if workflow_status is None else workflow_status.name
 
     return Job(uuid=handler.id, name=workflow_name, status=status, result=results)
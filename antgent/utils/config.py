@@ -1,4 +1,4 @@
-import json
+from pydantic import ValidationError
 
 from antgent.models.agent import DynamicAgentConfig
 
@@ -12,16 +12,16 @@ def parse_dynamic_agent_config(agent_config_json: str | None) -> DynamicAgentCon
         return None
 
     try:
-        config_dict = json.loads(agent_config_json)
-        validated = DynamicAgentConfig.model_validate(config_dict)
+        # Parse and validate in a single pass
+        validated = DynamicAgentConfig.model_validate_json(agent_config_json)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise ValueError(f"Invalid JSON for agent_config_json: {e}") from e
+        raise ValueError(f"Invalid DynamicAgentConfig structure: {e}") from e
 
-        # If no overrides specified, return None
-        if not validated.model and not validated.aliases and not validated.agents:
-            return None
+    # If no overrides specified, return None
+    if not validated.model and not validated.aliases and not validated.agents:
+        return None
 
-        # Return as Pydantic model
-        return validated
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON for agent_config_json: {e}") from e
-    except Exception as e:
-        raise ValueError(f"Invalid DynamicAgentConfig structure: {e}") from e
+    # Return as Pydantic model
+    return validated
@@ -84,6 +84,9 @@ MIME_TYPE_MAP = {
     ".ps1": "application/x-powershell",
 }
 
+# Suffixes decoded as text even though their MIME type isn't text/*
+TEXT_SUFFIXES = frozenset({".txt", ".md", ".csv", ".json", ".yaml", ".yml"})
+
 
 def load_file_to_content(file_path: str | Path, title: str | None = None) -> Content:
     """
@@ -142,7 +145,7 @@ def load_file_to_content(file_path: str | Path, title: str | None = None) -> Con
     mime_type = mime_type or "application/octet-stream"
 
     # Handle text files specially - decode to string
-    if mime_type.startswith("text/") or path.suffix.lower() in [".txt", ".md", ".csv", ".json", ".yaml", ".yml"]:
+    if suffix in TEXT_SUFFIXES or mime_type.startswith("text/"):
         try:
             text_content = file_bytes.decode("utf-8")
             return Content(mode="string", mime=mime_type, content=text_content, title=filename)
@@ -151,7 +154,7 @@ def load_file_to_content(file_path: str | Path, title: str | None = None) -> Con
             pass
 
     # Handle docx - extract text content
-    if path.suffix.lower() == ".docx":
+    if suffix == ".docx":
         text_content = extract_text_from_bytes(file_bytes, filename)
         return Content(mode="string", mime="text/plain", content=text_content, title=filename)
 
@@ -7,6 +7,8 @@ from fastapi import HTTPException, UploadFile
 from openpyxl import Workbook  # type: ignore
 from pydantic import BaseModel, ValidationError
 
+from antgent.utils.tables import row_values
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,34 +29,32 @@ def parse_excel_to_models[T: BaseModel](file: UploadFile, model_cls: type[T]) ->
         raise HTTPException(status_code=400, detail="File must be an .xlsx file.")
     try:
         # load_workbook can take a file-like object directly.
-        # file.file is a SpooledTemporaryFile which is a file-like object
-        workbook = openpyxl.load_workbook(file.file)
-        sheet = workbook.active
-        if not sheet:
-            raise ValueError("The workbook is empty or the active sheet could not be found.")
-
-        # Read headers from the first row
-        headers = [cell.value for cell in sheet[1]]
-        if not all(headers):
-            raise ValueError("The header row contains empty cells.")
-
-        raw_table = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            # Skip empty rows
-            if not any(row):
-                continue
-            row_data = dict(zip(headers, row, strict=False))
-
-            # Sanitize boolean-like strings
-            for key, value in row_data.items():
-                row_data[key] = _str_to_bool(value)
-
-            raw_table.append(row_data)
-
-        if not raw_table:
-            return []
-
-        return [model_cls.model_validate(item) for item in raw_table]
+        # file.file is a SpooledTemporaryFile which is a file-like object.
+        # Read-only mode streams the rows instead of building every cell object.
+        workbook = openpyxl.load_workbook(file.file, read_only=True, data_only=True)
+        try:
+            sheet = workbook.active
+            if not sheet:
+                raise ValueError("The workbook is empty or the active sheet could not be found.")
+
+            # Read headers from the first row
+            headers = next(sheet.iter_rows(max_row=1, values_only=True), ())
+            if not headers or not all(headers):
+                raise ValueError("The header row contains empty cells.")
+            # Unsized sheets yield ragged rows in read-only mode, max_col pads them to the headers
+            rows = sheet.iter_rows(min_row=2, max_col=len(headers), values_only=True)
+
+            # Rows are validated as they are read, empty ones are skipped and
+            # boolean-like strings are sanitized
+            return [
+                model_cls.model_validate(
+                    {header: _str_to_bool(value) for header, value in zip(headers, row, strict=False)}
+                )
+                for row in rows
+                if any(row)
+            ]
+        finally:
+            workbook.close()
     except ValidationError as e:
         logger.error("Pydantic validation failed during Excel parsing: %s", e, exc_info=True)
         raise HTTPException(status_code=400, detail=f"Excel data does not match expected schema: {e}") from e
@@ -78,23 +78,16 @@ def list_dict_to_xlsx_bytes(data: list[dict[str, Any]]) -> bytes:
     if not data:
         return b""
 
-    workbook = Workbook()
-    sheet = workbook.active
-
-    # Write headers
-    headers = list(data[0].keys())
-    for col_num, header_title in enumerate(headers, 1):
-        cell = sheet.cell(row=1, column=col_num)
-        cell.value = header_title
+    # Write-only workbooks stream rows to the file instead of keeping a Cell object per value
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
 
-    # Write data rows
-    for row_num, row_data in enumerate(data, 2):
-        for col_num, header in enumerate(headers, 1):
-            cell = sheet.cell(row=row_num, column=col_num)
-            cell.value = row_data.get(header)
+    headers = tuple(data[0].keys())
+    sheet.append(headers)
+    for values in row_values(data, headers):
+        sheet.append(values)
 
     # Save to a bytes buffer
     buffer = io.BytesIO()
     workbook.save(buffer)
-    buffer.seek(0)
     return buffer.getvalue()
@@ -1,4 +1,6 @@
 import importlib
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 
@@ -11,7 +13,12 @@ class ImportFromStringError(Exception):
 def import_from_string(import_str: Any) -> Any:
     if not isinstance(import_str, str):
         return import_str
+    return _import_from_string(import_str)
 
+
+@lru_cache(maxsize=512)
+def _import_from_string(import_str: str) -> Any:
+    """Resolved objects are cached per import string, failures are not."""
     module_str, _, attrs_str = import_str.partition(":")
     if not module_str or not attrs_str:
         message = 'Import string "{import_str}" must be in format "<module>:<attribute>".'
@@ -25,10 +32,9 @@ def import_from_string(import_str: Any) -> Any:
         message = 'Could not import module "{module_str}".'
         raise ImportFromStringError(message.format(module_str=module_str)) from None
 
-    instance = module
     try:
-        for attr_str in attrs_str.split("."):
-            instance = getattr(instance, attr_str)
+        # attrgetter walks dotted paths ("Class.attr") in a single call
+        instance = attrgetter(attrs_str)(module)
     except AttributeError:
         message = 'Attribute "{attrs_str}" not found in module "{module_str}".'
         raise ImportFromStringError(message.format(attrs_str=attrs_str, module_str=module_str)) from None
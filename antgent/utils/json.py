@@ -1,13 +1,27 @@
-import json
-import re
+from pydantic_core import from_json
+
+JSON_FENCE = "```json"
+FENCE = "```"
+
+
+def _fenced_json(input_str: str) -> str | None:
+    """
+    Returns the {...} object of a ```json fenced block: from the first '{' after the opening fence
+    to the last '}' that is followed by a closing fence. Same match as the former
+    ```json.*?(\\{.*\\}).*?``` regex, found with linear scans instead of backtracking.
+    """
+    start = input_str.find(JSON_FENCE)
+    if start == -1:
+        return None
+    left = input_str.find("{", start + len(JSON_FENCE))
+    if left == -1:
+        return None
+    right = input_str.rfind("}", left, input_str.rfind(FENCE))
+    if right == -1:
+        return None
+    return input_str[left : right + 1]
 
 
 def parse_json_mk(input_str: str) -> dict:
-    regex = r"```json.*?(\{.*\}).*?```"
-    matches = re.search(regex, input_str, re.DOTALL | re.MULTILINE)
-    if matches:
-        res = matches.group(1)
-        jsonoutput = json.loads(res)
-    else:
-        jsonoutput = json.loads(input_str)
-    return jsonoutput
+    res = _fenced_json(input_str)
+    return from_json(input_str if res is None else res)
@@ -12,7 +12,8 @@ def truncate_for_log(value: Any, max_len: int = 200) -> str:
     Returns:
         Truncated string representation with "..." if truncated
     """
-    str_val = str(value)
+    # Strings (the common case) skip the str() call
+    str_val = value if type(value) is str else str(value)
     if len(str_val) <= max_len:
         return str_val
-    return str_val[:max_len] + "..."
+    return f"{str_val[:max_len]}..."
@@ -10,6 +10,8 @@ from openai.types.responses import EasyInputMessageParam, ResponseInputFileParam
 logger = logging.getLogger(__name__)
 logging.getLogger("fontTools.subset").level = logging.WARN
 
+FONT_PATH = str(pathlib.Path(__file__).parent.parent.resolve().joinpath("files/DejaVuSans.ttf"))
+
 
 def text_to_pdf(text: str) -> bytes:
     """
@@ -22,11 +24,11 @@ def text_to_pdf(text: str) -> bytes:
     Returns:
         The PDF content as bytes.
     """
+    # An FPDF document can't be reused once output() was called, only the font path is shared
     pdf = FPDF()
     pdf.add_page()
 
-    font_path = pathlib.Path(__file__).parent.parent.resolve().joinpath("files/DejaVuSans.ttf")
-    pdf.add_font("dejavu-sans", style="", fname=str(font_path))
+    pdf.add_font("dejavu-sans", style="", fname=FONT_PATH)
     pdf.set_font(family="dejavu-sans", style="", size=8)
 
     pdf.multi_cell(w=0, h=5, text=text)
@@ -52,9 +54,11 @@ def text_to_pdf_message(
     content_b64 = base64.b64encode(byte_content).decode("utf-8")
     if not filename:
         filename = "file.pdf"
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False, delete_on_close=False) as temp_file:
-        temp_file.write(byte_content)
-        logger.info("PDF file created at %s", temp_file.name)
+    if logger.isEnabledFor(logging.DEBUG):
+        # Keep a copy of the generated PDF around for inspection
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False, delete_on_close=False) as temp_file:
+            temp_file.write(byte_content)
+            logger.debug("PDF file created at %s", temp_file.name)
     return EasyInputMessageParam(
         role=role,
         content=[
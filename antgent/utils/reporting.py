@@ -1,10 +1,27 @@
 import io
+from collections.abc import Callable
 from typing import Any
 
 from docx import Document
 from docx.document import Document as DocumentClass
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.xmlchemy import BaseOxmlElement
+from docx.shared import RGBColor
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 from htmldocx import HtmlToDocx  # type: ignore
 from markdown_it import MarkdownIt
+from markdown_it.renderer import RendererHTML
+from markdown_it.token import Token
+
+from antgent.utils.tables import row_values
+
+_markdown = MarkdownIt()
+# Renders the inline tokens of lines with inline HTML, typed: MarkdownIt.renderer is a RendererProtocol
+_html_renderer = RendererHTML()
+LINK_COLOR = RGBColor(0x00, 0x00, 0xEE)
 
 
 def _add_metadata_sections(document: DocumentClass, metadata_sections: dict[str, str]) -> None:
@@ -28,21 +45,22 @@ def _add_table_to_document(document: DocumentClass, title: str, table_data: list
         return
 
     document.add_heading(title, level=2)
-    headers = list(table_data[0].keys())
-    table = document.add_table(rows=1, cols=len(headers))
+    headers = tuple(table_data[0].keys())
+    # All rows are created by add_table, instead of an add_row() call (and its cells lookup) per row
+    table = document.add_table(rows=len(table_data) + 1, cols=len(headers))
     table.style = "Table Grid"
+    rows = iter(table.rows)
 
     # Set headers and make them bold
-    hdr_cells = table.rows[0].cells
-    for i, header in enumerate(headers):
-        hdr_cells[i].text = header
+    hdr_cells = next(rows).cells
+    for cell, header in zip(hdr_cells, headers, strict=True):
+        cell.text = header
     _make_header_cells_bold(hdr_cells)
 
-    # Add data rows
-    for row_data in table_data:
-        row_cells = table.add_row().cells
-        for i, header in enumerate(headers):
-            row_cells[i].text = str(row_data.get(header, ""))
+    # Fill data rows
+    for row, values in zip(rows, row_values(table_data, headers, default=""), strict=True):
+        for cell, value in zip(row.cells, values, strict=True):
+            cell.text = str(value)
 
 
 def _add_tables(document: DocumentClass, tables: dict[str, list[dict[str, Any]]]) -> None:
@@ -51,6 +69,161 @@ def _add_tables(document: DocumentClass, tables: dict[str, list[dict[str, Any]]]
         _add_table_to_document(document, title, table_data)
 
 
+class _MarkdownDocxWriter:
+    """
+    Emits docx paragraphs straight from the markdown-it token stream, without rendering HTML first.
+    Raw HTML (blocks, and lines with inline tags) is the only content still going through HtmlToDocx.
+    """
+
+    def __init__(self, document: DocumentClass) -> None:
+        self.document = document
+        self.paragraph: Paragraph | None = None
+        self.list_styles: list[str] = []
+        self.item_style: str | None = None
+        self.quote_depth = 0
+        self._html: HtmlToDocx | None = None
+
+    def write(self, tokens: list[Token]) -> None:
+        for token in tokens:
+            handler = _BLOCK_HANDLERS.get(token.type)
+            if handler is not None:
+                handler(self, token)
+
+    def _paragraph_open(self, token: Token) -> None:
+        self._new_paragraph(token)
+
+    def _new_paragraph(self, token: Token) -> Paragraph:
+        # The first paragraph of a list item carries the bullet/number
+        style = self.item_style or ("Quote" if self.quote_depth else None)
+        self.item_style = None
+        self.paragraph = self.document.add_paragraph(style=style)
+        return self.paragraph
+
+    def _heading(self, token: Token) -> None:
+        self.paragraph = self.document.add_heading(level=int(token.tag[1:]))
+
+    def _end_block(self, token: Token) -> None:
+        self.paragraph = None
+
+    def _list_open(self, token: Token) -> None:
+        base = "List Bullet" if token.type == "bullet_list_open" else "List Number"
+        depth = len(self.list_styles) + 1
+        self.list_styles.append(base if depth == 1 else f"{base} {min(depth, 3)}")
+
+    def _list_close(self, token: Token) -> None:
+        self.list_styles.pop()
+
+    def _list_item(self, token: Token) -> None:
+        self.item_style = self.list_styles[-1]
+
+    def _quote_open(self, token: Token) -> None:
+        self.quote_depth += 1
+
+    def _quote_close(self, token: Token) -> None:
+        self.quote_depth -= 1
+
+    def _code_block(self, token: Token) -> None:
+        run = self.document.add_paragraph().add_run(token.content.rstrip("\n"))
+        run.font.name = "Courier New"
+
+    def _hr(self, token: Token) -> None:
+        self.document.add_paragraph()
+
+    def _html_block(self, token: Token) -> None:
+        if self._html is None:
+            self._html = HtmlToDocx()
+        self._html.add_html_to_document(token.content, self.document)
+
+    def _inline(self, token: Token) -> None:
+        paragraph = self.paragraph or self._new_paragraph(token)
+        children = token.children or []
+        if any(child.type == "html_inline" for child in children):
+            # Inline HTML tags (<b>, <br>...) wrap markdown text, the whole line goes through HtmlToDocx
+            self._inline_html(paragraph, children)
+            return
+
+        bold = italic = 0
+        hyperlink = None
+        for child in children:
+            kind = child.type
+            if kind in {"text", "image"} and child.content:
+                # Images are not embedded, their alt text is kept
+                run = paragraph.add_run(child.content)
+                run.bold = bold > 0 or None
+                run.italic = italic > 0 or None
+                if hyperlink is not None:
+                    _link_run(hyperlink, run)
+            elif kind == "strong_open":
+                bold += 1
+            elif kind == "strong_close":
+                bold -= 1
+            elif kind == "em_open":
+                italic += 1
+            elif kind == "em_close":
+                italic -= 1
+            elif kind == "link_open":
+                hyperlink = _add_hyperlink(paragraph, str(child.attrGet("href") or ""))
+            elif kind == "link_close":
+                hyperlink = None
+            elif kind == "code_inline":
+                paragraph.add_run(child.content).font.name = "Courier New"
+            elif kind == "softbreak":
+                paragraph.add_run(" ")
+            elif kind == "hardbreak":
+                paragraph.add_run().add_break()
+
+    def _inline_html(self, paragraph: Paragraph, children: list[Token]) -> None:
+        _add_html_runs(self.document, paragraph, _html_renderer.renderInline(children, _markdown.options, {}))
+
+
+def _add_html_runs(document: DocumentClass, paragraph: Paragraph, html: str) -> None:
+    """
+    Appends the runs of an inline HTML fragment to an existing paragraph.
+    HtmlToDocx only has a public API for whole documents/cells: this drives its internals (set_initial_attrs,
+    run_process, the paragraph/run attributes), written against htmldocx 0.0.6, which is pinned for it.
+    """
+    parser = HtmlToDocx()
+    parser.set_initial_attrs(document)
+    parser.paragraph = paragraph
+    parser.run = paragraph.add_run()
+    parser.run_process(html)
+
+
+def _add_hyperlink(paragraph: Paragraph, href: str) -> BaseOxmlElement:
+    """Appends an empty external w:hyperlink to the paragraph, runs are moved into it with _link_run."""
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.set(qn("r:id"), paragraph.part.relate_to(href, RT.HYPERLINK, is_external=True))
+    paragraph._p.append(hyperlink)
+    return hyperlink
+
+
+def _link_run(hyperlink: BaseOxmlElement, run: Run) -> None:
+    # Same look as HtmlToDocx links: blue and underlined
+    run.font.color.rgb = LINK_COLOR
+    run.font.underline = True
+    hyperlink.append(run._r)
+
+
+_BLOCK_HANDLERS: dict[str, Callable[[_MarkdownDocxWriter, Token], None]] = {
+    "heading_open": _MarkdownDocxWriter._heading,
+    "heading_close": _MarkdownDocxWriter._end_block,
+    "paragraph_open": _MarkdownDocxWriter._paragraph_open,
+    "paragraph_close": _MarkdownDocxWriter._end_block,
+    "bullet_list_open": _MarkdownDocxWriter._list_open,
+    "ordered_list_open": _MarkdownDocxWriter._list_open,
+    "bullet_list_close": _MarkdownDocxWriter._list_close,
+    "ordered_list_close": _MarkdownDocxWriter._list_close,
+    "list_item_open": _MarkdownDocxWriter._list_item,
+    "blockquote_open": _MarkdownDocxWriter._quote_open,
+    "blockquote_close": _MarkdownDocxWriter._quote_close,
+    "fence": _MarkdownDocxWriter._code_block,
+    "code_block": _MarkdownDocxWriter._code_block,
+    "hr": _MarkdownDocxWriter._hr,
+    "html_block": _MarkdownDocxWriter._html_block,
+    "inline": _MarkdownDocxWriter._inline,
+}
+
+
 def markdown_to_docx_bytes(
     main_content_md: str,
     metadata_sections: dict[str, str] | None = None,
@@ -88,11 +261,7 @@ def markdown_to_docx_bytes(
 
     document.add_heading(main_content_title, level=1)
 
-    md = MarkdownIt()
-    html_content = md.render(main_content_md)
-
-    parser = HtmlToDocx()
-    parser.add_html_to_document(html_content, document)
+    _MarkdownDocxWriter(document).write(_markdown.parse(main_content_md))
 
     doc_io = io.BytesIO()
     document.save(doc_io)
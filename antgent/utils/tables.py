@@ -0,0 +1,26 @@
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from operator import itemgetter
+from typing import Any
+
+
+def row_values(
+    rows: Iterable[Mapping[str, Any]], headers: Sequence[str], default: Any = None
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Yields the values of each row in headers order, one itemgetter call per complete row.
+    Rows missing a header fall back to .get() with `default`; without headers every row is empty.
+    """
+    if not headers:
+        for _ in rows:
+            yield ()
+        return
+
+    get_row = itemgetter(*headers)
+    single = len(headers) == 1  # itemgetter with a single key returns the value, not a tuple
+    for row in rows:
+        try:
+            values = get_row(row)
+        except KeyError:
+            yield tuple(row.get(header, default) for header in headers)
+            continue
+        yield (values,) if single else values
@@ -1,11 +1,162 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+
+import tiktoken
+
 from antgent.models.agent import TLLMInput
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def get_encoder(model: str) -> tiktoken.Encoding:
+    """
+    Returns the tiktoken encoder for the given model.
+    Loading the BPE tables is expensive, the encoder is cached per model.
+    """
+    return tiktoken.encoding_for_model(model)
+
+
+def preload_encoder(model: str = "gpt-4o") -> None:
+    """
+    Loads the encoder ahead of time so the first request doesn't pay for the BPE table load
+    (or its download on a cold tiktoken cache). Failures are logged, counting falls back lazily.
+    """
+    try:
+        get_encoder(model)
+    except Exception as e:
+        logger.warning("Failed to preload tiktoken encoder for %s: %s", model, e)
+
+
+# Chat format overhead, same accounting as litellm/openai cookbook
+TOKENS_PER_MESSAGE = 3
+TOKENS_REPLY_PRIMING = 3
+
+
+@lru_cache(maxsize=64)
+def _encoder_for(model: str) -> tiktoken.Encoding | None:
+    """
+    Returns the tiktoken encoder for a (provider-prefixed) model name, None if tiktoken doesn't know it.
+    Misses are cached too, non-OpenAI models go straight to litellm.
+    """
+    try:
+        return get_encoder(model.rpartition("/")[2])
+    except KeyError:
+        return None
+
+
+# Approximation used to truncate text for models tiktoken doesn't know
+FALLBACK_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=8)
+def encode_text(model: str, text: str) -> tuple[int, ...]:
+    """
+    Token ids of text for the model, cached so that counting then truncating the same text
+    only runs the BPE once.
+    """
+    encoder = _encoder_for(model) or tiktoken.get_encoding(FALLBACK_ENCODING)
+    return tuple(encoder.encode_ordinary(text))
+
+
+def truncate_tokens(model: str, text: str, max_tokens: int) -> str:
+    """Returns text cut to its first max_tokens tokens."""
+    ids = encode_text(model, text)
+    if len(ids) <= max_tokens:
+        return text
+    encoder = _encoder_for(model) or tiktoken.get_encoding(FALLBACK_ENCODING)
+    return encoder.decode(ids[: max(max_tokens, 0)])
+
+
+def split_by_tokens(model: str, text: str, max_tokens: int, overlap: int = 0) -> list[str]:
+    """
+    Splits text on paragraph boundaries into chunks of at most max_tokens tokens (a single paragraph larger
+    than that is kept whole). Each chunk starts with the trailing paragraphs of the previous one, up to
+    `overlap` tokens, to keep context across the cut.
+    """
+    paragraphs = [p for p in text.split("\n\n") if p.strip()]
+    encoder = _encoder_for(model) or tiktoken.get_encoding(FALLBACK_ENCODING)
+    sizes = [len(ids) for ids in encoder.encode_ordinary_batch(paragraphs)]
+
+    chunks: list[str] = []
+    current: list[int] = []  # paragraph indexes of the chunk being built
+    current_size = 0
+    for idx, size in enumerate(sizes):
+        if current and current_size + size > max_tokens:
+            chunks.append("\n\n".join(paragraphs[i] for i in current))
+            # Carry over the tail of the chunk as overlap
+            carried: list[int] = []
+            carried_size = 0
+            for i in reversed(current):
+                if carried_size + sizes[i] > overlap or carried_size + sizes[i] + size > max_tokens:
+                    break
+                carried.insert(0, i)
+                carried_size += sizes[i]
+            current, current_size = carried, carried_size
+        current.append(idx)
+        current_size += size
+    if current:
+        chunks.append("\n\n".join(paragraphs[i] for i in current))
+    return chunks
+
+
+def _count_text_messages(encoder: tiktoken.Encoding, messages: list) -> int | None:
+    """
+    Counts plain {role, content: str} chat messages with a single encode_batch call.
+    Returns None if a message has any other shape (multimodal, tool calls...).
+    """
+    texts: list[str] = []
+    for message in messages:
+        if not isinstance(message, dict) or not message.keys() <= {"role", "content"}:
+            return None
+        content = message.get("content")
+        if not isinstance(content, str):
+            return None
+        texts.append(content)
+        texts.append(message.get("role", ""))
+    encoded = encoder.encode_ordinary_batch(texts)
+    return sum(len(tokens) for tokens in encoded) + TOKENS_PER_MESSAGE * len(messages) + TOKENS_REPLY_PRIMING
+
 
 def estimate_tokens(model: str, messages: TLLMInput, tools: list[dict] | None = None) -> int:
     """
     Returns an accurate token estimation for the given model,
     handling multimodal messages, text, and tool schemas.
     """
+    if tools is None:
+        # Models known by tiktoken: encode directly, skipping litellm's dispatch
+        encoder = _encoder_for(model)
+        if encoder is not None:
+            if isinstance(messages, str):
+                return len(encode_text(model, messages))
+            count = _count_text_messages(encoder, messages)
+            if count is not None:
+                return count
+
     from litellm.utils import token_counter  # noqa: PLC0415
 
     return token_counter(model=model, messages=messages, tools=tools)  # type: ignore
+
+
+_TOKEN_CACHE_SIZE = 256
+_token_cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+
+
+def estimate_tokens_cached(model: str, messages: TLLMInput) -> int:
+    """
+    Same as estimate_tokens, memoized on a digest of the messages.
+    Identical inputs (e.g. the same content re-checked across summarizer iterations)
+    skip the tokenization.
+    """
+    key = (model, hashlib.blake2b(repr(messages).encode(), digest_size=16).digest())
+    count = _token_cache.get(key)
+    if count is not None:
+        _token_cache.move_to_end(key)
+        return count
+    count = estimate_tokens(model, messages=messages)
+    _token_cache[key] = count
+    if len(_token_cache) > _TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return count
@@ -82,8 +82,8 @@ class TextSummarizerAllWorkflow(BaseWorkflow[SummaryInput, InternalSummariesAllR
             summary_types: set[SummaryType] = set(SummaryType)
             tasks = []
             for summary_type in summary_types:
-                task_ctx = ctx.model_copy(deep=True)
-                task_ctx.summary_type = summary_type
+                # Shallow copy, the (large) content is shared and serialized once per activity anyway
+                task_ctx = ctx.model_copy(update={"summary_type": summary_type})
                 tasks.append(
                     workflow.execute_activity(
                         run_summarizer_one_type_activity,
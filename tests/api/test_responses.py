@@ -0,0 +1,34 @@
+import datetime
+import enum
+
+import pytest
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, from_json
+
+from antgent.server.responses import PydanticJSONResponse
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Progress(BaseModel):
+    step: int
+    at: datetime.datetime
+
+
+def test_render_native_types():
+    at = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC)
+    response = PydanticJSONResponse({"progress": Progress(step=1, at=at), "color": Color.RED, "tags": ("a",)})
+
+    assert response.media_type == "application/json"
+    assert from_json(response.body) == {
+        "progress": {"step": 1, "at": "2024-01-02T03:04:05Z"},
+        "color": "red",
+        "tags": ["a"],
+    }
+
+
+def test_render_unknown_type_raises():
+    with pytest.raises(PydanticSerializationError):
+        PydanticJSONResponse({"value": object()})
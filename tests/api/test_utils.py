@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import io
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -5,6 +7,15 @@ import pytest
 from fastapi import UploadFile
 
 from antgent.server.api.utils import prep_contents
+from antgent.services import s3_uploader
+
+
+@pytest.fixture(autouse=True)
+def clear_year_month_cache():
+    """The upload folder is cached across calls, each test patches datetime on its own."""
+    s3_uploader.clear_year_month_cache()
+    yield
+    s3_uploader.clear_year_month_cache()
 
 
 @pytest.mark.asyncio
@@ -26,8 +37,8 @@ class TestPrepContents:
 
         # Prepare text content
         texts = ["This is test content"]
-        with patch("antgent.services.s3_uploader.uuid") as mock_uuid:
-            mock_uuid.uuid4.return_value.hex = "abc123"
+        with patch("antgent.services.s3_uploader.secrets") as mock_secrets:
+            mock_secrets.token_hex.return_value = "abc123"
             with patch("antgent.services.s3_uploader.datetime") as mock_datetime:
                 mock_now = MagicMock()
                 mock_now.strftime.return_value = "2025-10"
@@ -71,6 +82,7 @@ class TestPrepContents:
         mock_file.read = AsyncMock(return_value=pdf_content)
         mock_file.seek = AsyncMock()
         mock_file.file = io.BytesIO(pdf_content)
+        mock_file.size = len(pdf_content)
 
         with patch("antgent.services.s3_uploader.datetime") as mock_datetime:
             mock_now = MagicMock()
@@ -160,6 +172,7 @@ class TestPrepContents:
         mock_file.read = AsyncMock(return_value=b"pdf content")
         mock_file.seek = AsyncMock()
         mock_file.file = io.BytesIO(b"pdf content")
+        mock_file.size = len(b"pdf content")
 
         with patch("antgent.services.s3_uploader.datetime") as mock_datetime:
             mock_now = MagicMock()
@@ -201,6 +214,7 @@ class TestPrepContents:
         mock_file.read = AsyncMock(return_value=b"pdf")
         mock_file.seek = AsyncMock()
         mock_file.file = io.BytesIO(b"pdf")
+        mock_file.size = len(b"pdf")
 
         with patch("antgent.services.s3_uploader.datetime") as mock_datetime:
             mock_now = MagicMock()
@@ -231,6 +245,7 @@ class TestPrepContents:
         mock_file.read = AsyncMock(return_value=b"text content")
         mock_file.seek = AsyncMock()
         mock_file.file = io.BytesIO(b"text content")
+        mock_file.size = len(b"text content")
 
         with patch("antgent.services.s3_uploader.datetime") as mock_datetime:
             mock_now = MagicMock()
@@ -241,3 +256,71 @@ class TestPrepContents:
 
         # Should guess MIME type from filename
         assert results[0].mime == "text/plain"
+
+    @patch("antgent.services.s3_uploader.s3_client")
+    async def test_prep_contents_hashes_small_file_inline(self, mock_s3_client):
+        """Files up to SMALL_FILE_SIZE are hashed on the event loop, without a thread hop."""
+        mock_s3 = MagicMock()
+        mock_s3.prefix = "uploads/"
+        mock_s3_client.return_value = mock_s3
+        mock_s3.upload_file_async = AsyncMock(return_value=MagicMock(url="s3://bucket/uploads/small.pdf"))
+
+        content = b"%PDF-1.4 small"
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.filename = "small.pdf"
+        mock_file.content_type = "application/pdf"
+        mock_file.file = io.BytesIO(content)
+        mock_file.size = len(content)
+
+        with patch("antgent.services.s3_uploader.asyncio.to_thread") as mock_to_thread:
+            results = await prep_contents(texts=None, files=[mock_file])
+
+        mock_to_thread.assert_not_called()
+        expected_hash = hashlib.blake2b(content, digest_size=s3_uploader.FINGERPRINT_SIZE).hexdigest()
+        assert f"small.pdf-{expected_hash}/small.pdf" in mock_s3.upload_file_async.call_args[1]["dest"]
+        # The file is rewound for the upload
+        assert mock_s3.upload_file_async.call_args[0][0].tell() == 0
+        assert results[0].title == "small.pdf"
+
+    @patch("antgent.services.s3_uploader.s3_client")
+    async def test_prep_contents_hashes_large_file_in_thread(self, mock_s3_client):
+        """Files above SMALL_FILE_SIZE (or of unknown size) are hashed in a worker thread."""
+        mock_s3 = MagicMock()
+        mock_s3.prefix = "uploads/"
+        mock_s3_client.return_value = mock_s3
+        mock_s3.upload_file_async = AsyncMock(return_value=MagicMock(url="s3://bucket/uploads/large.pdf"))
+
+        content = b"x" * (s3_uploader.SMALL_FILE_SIZE + 1)
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.filename = "large.pdf"
+        mock_file.content_type = "application/pdf"
+        mock_file.file = io.BytesIO(content)
+        mock_file.size = len(content)
+
+        with patch("antgent.services.s3_uploader.asyncio.to_thread", side_effect=asyncio.to_thread) as mock_to_thread:
+            await prep_contents(texts=None, files=[mock_file])
+
+        mock_to_thread.assert_called_once_with(s3_uploader._hash_fileobj, mock_file.file)
+        expected_hash = hashlib.blake2b(content, digest_size=s3_uploader.FINGERPRINT_SIZE).hexdigest()
+        assert f"large.pdf-{expected_hash}/large.pdf" in mock_s3.upload_file_async.call_args[1]["dest"]
+        assert mock_s3.upload_file_async.call_args[0][0].tell() == 0
+
+    @patch("antgent.services.s3_uploader.s3_client")
+    async def test_prep_contents_year_month_is_cached(self, mock_s3_client):
+        """The upload folder is formatted once and reused until the cache expires or is cleared."""
+        mock_s3 = MagicMock()
+        mock_s3.prefix = "uploads/"
+        mock_s3_client.return_value = mock_s3
+        mock_s3.upload_file_async = AsyncMock(return_value=MagicMock(url="s3://bucket/uploads/t.txt"))
+
+        with patch("antgent.services.s3_uploader.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "2025-10"
+            await prep_contents(texts=["a"], files=None)
+            mock_datetime.now.return_value.strftime.return_value = "2025-11"
+            await prep_contents(texts=["b"], files=None)
+            assert "2025-10/" in mock_s3.upload_file_async.call_args[1]["dest"]
+            mock_datetime.now.assert_called_once()
+
+            s3_uploader.clear_year_month_cache()
+            await prep_contents(texts=["c"], files=None)
+            assert "2025-11/" in mock_s3.upload_file_async.call_args[1]["dest"]
@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic_core import from_json
+
+from antgent.server.api.workflows import list as workflows_list
+
+EXECUTION = {"workflow_id": "wf-1", "status": "COMPLETED"}
+
+
+def _client(fail_after: int | None) -> MagicMock:
+    async def list_workflows(**_):
+        for _ in range(2):
+            if fail_after == 0:
+                raise RuntimeError("temporal down")
+            yield MagicMock()
+        if fail_after is not None:
+            raise RuntimeError("temporal down")
+
+    client = MagicMock()
+    client.list_workflows = list_workflows
+    return client
+
+
+@pytest.fixture
+def http(app):
+    return TestClient(app)
+
+
+def _get(http: TestClient, client: MagicMock, output_format: str):
+    with (
+        patch.object(workflows_list, "tclient", AsyncMock(return_value=client)),
+        patch.object(workflows_list, "_process_workflow_execution", return_value=EXECUTION),
+    ):
+        return http.get("/api/workflows", params={"format": output_format})
+
+
+def _lines(response) -> list[dict]:
+    return [from_json(line) for line in response.text.splitlines()]
+
+
+def test_list_workflows_ndjson(http):
+    response = _get(http, _client(fail_after=None), "ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert _lines(response) == [EXECUTION, EXECUTION]
+
+
+@pytest.mark.parametrize("fail_after", [0, 2])
+def test_list_workflows_ndjson_error_line(http, fail_after):
+    response = _get(http, _client(fail_after=fail_after), "ndjson")
+
+    # the stream already started: the failure is reported on the last line
+    assert response.status_code == 200
+    assert _lines(response) == [EXECUTION] * fail_after + [{"error": workflows_list.LIST_ERROR}]
+
+
+def test_list_workflows_array_error(http):
+    response = _get(http, _client(fail_after=2), "array")
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == workflows_list.LIST_ERROR
@@ -1,5 +1,6 @@
 import os
 from collections.abc import AsyncGenerator
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -8,6 +9,7 @@ from temporalio.testing import WorkflowEnvironment
 from temporalloop.converters.pydantic import pydantic_data_converter
 
 from antgent.config import config
+from antgent.utils import token
 
 LOCAL_DIR = os.path.dirname(__file__)
 
@@ -57,3 +59,24 @@ def app():
 @pytest.fixture(autouse=True)
 def reset_config():
     config(reload=True)
+
+
+class WordEncoder:
+    """One token per word, the tiktoken encoders need a download."""
+
+    def encode_ordinary(self, text: str) -> list[str]:
+        return text.split()
+
+    def encode_ordinary_batch(self, texts: list[str]) -> list[list[str]]:
+        return [self.encode_ordinary(text) for text in texts]
+
+    def decode(self, ids) -> str:
+        return " ".join(ids)
+
+
+@pytest.fixture
+def word_tokens():
+    token.encode_text.cache_clear()
+    with patch.object(token, "_encoder_for", return_value=WordEncoder()):
+        yield
+    token.encode_text.cache_clear()
@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic_core import from_json, to_json
+
+from antgent.agents.base import BaseAgent
+from antgent.agents.batch import BATCH_ENDPOINT, BatchFailedError
+from antgent.agents.summarizer.models import SummaryGrade, SummaryGradeCtx
+from antgent.agents.summarizer.summary_judge import SummaryJudgeAgent
+from antgent.models.agent import AgentConfig, AgentFrozenConfig
+
+GRADE = SummaryGrade(grade=7, feedbacks=["f"], grade_reasoning="r", missing_entities=[])
+
+
+class TextAgent(BaseAgent[str, str]):
+    name_id = "Text"
+    default_config = AgentConfig(name="Text", model="gpt-4o", client="openai")
+    agent_config = AgentFrozenConfig[str, str](output_cls=str, structured=False)
+
+    def prompt(self) -> str:
+        return "prompt"
+
+
+def _ctx(n: int) -> SummaryGradeCtx:
+    return SummaryGradeCtx(short_version=f"short {n}", description="d", title="t", language="en", original_text="o")
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.files.create = AsyncMock(return_value=MagicMock(id="file-1"))
+    client.batches.create = AsyncMock(return_value=MagicMock(id="batch-1"))
+    client.batches.retrieve = AsyncMock()
+    client.files.content = AsyncMock()
+    with patch("antgent.agents.batch.openai_aclient", return_value=client):
+        yield client
+
+
+def _submitted(client: MagicMock) -> list[dict]:
+    _, data = client.files.create.await_args.kwargs["file"]
+    return [from_json(line) for line in data.split(b"\n")]
+
+
+@pytest.mark.parametrize("model", ["openai/gpt-4.1", "gpt-4.1"])
+async def test_submit_batch(client, model):
+    agent = SummaryJudgeAgent(conf=AgentConfig(model=model))
+
+    assert await agent.submit_batch([_ctx(0), _ctx(1)]) == "batch-1"
+
+    requests = _submitted(client)
+    assert [r["custom_id"] for r in requests] == ["0", "1"]
+    assert all(r["url"] == BATCH_ENDPOINT and r["method"] == "POST" for r in requests)
+    body = requests[1]["body"]
+    # no provider prefix, the Batch API takes the bare model name
+    assert body["model"] == "gpt-4.1"
+    assert body["messages"][0] == {"role": "system", "content": agent.prompt()}
+    assert "short 1" in body["messages"][1]["content"]
+    # strict schema, as sent by the SDK on a direct run
+    json_schema = body["response_format"]["json_schema"]
+    assert body["response_format"]["type"] == "json_schema"
+    assert json_schema["strict"] is True
+    assert json_schema["schema"]["additionalProperties"] is False
+    assert set(json_schema["schema"]["required"]) == set(SummaryGrade.model_fields)
+    client.batches.create.assert_awaited_once_with(
+        input_file_id="file-1", endpoint=BATCH_ENDPOINT, completion_window="24h"
+    )
+
+
+async def test_submit_batch_plain_text(client):
+    await TextAgent().submit_batch(["ctx"], llm_input="a")
+
+    body = _submitted(client)[0]["body"]
+    assert "response_format" not in body
+    assert body["messages"][1] == {"role": "user", "content": "a"}
+
+
+@pytest.mark.parametrize("status", ["validating", "in_progress", "finalizing"])
+async def test_poll_batch_running(client, status):
+    client.batches.retrieve.return_value = MagicMock(status=status)
+    assert await SummaryJudgeAgent().poll_batch("batch-1") is None
+    client.files.content.assert_not_awaited()
+
+
+@pytest.mark.parametrize("status", ["failed", "expired", "cancelled"])
+async def test_poll_batch_failed(client, status):
+    client.batches.retrieve.return_value = MagicMock(status=status)
+    with pytest.raises(BatchFailedError):
+        await SummaryJudgeAgent().poll_batch("batch-1")
+
+
+def _line(custom_id: str, content: str | None = None, status_code: int = 200, error: dict | None = None) -> str:
+    body = {"choices": [{"message": {"content": content}}]}
+    return to_json(
+        {"custom_id": custom_id, "response": {"status_code": status_code, "body": body}, "error": error}
+    ).decode()
+
+
+async def test_poll_batch_results(client):
+    client.batches.retrieve.return_value = MagicMock(
+        status="completed", output_file_id="out-1", request_counts=MagicMock(total=4)
+    )
+    lines = [
+        _line("2", GRADE.model_dump_json()),
+        _line("0", GRADE.model_copy(update={"grade": 3}).model_dump_json()),
+        "",
+        _line("1", status_code=500),
+        _line("3", error={"message": "boom"}),
+    ]
+    client.files.content.return_value = MagicMock(text="\n".join(lines))
+
+    results = await SummaryJudgeAgent().poll_batch("batch-1")
+
+    # submission order, None for the failed requests
+    assert results == [GRADE.model_copy(update={"grade": 3}), None, GRADE, None]
+    client.files.content.assert_awaited_once_with("out-1")
+
+
+async def test_poll_batch_plain_text(client):
+    client.batches.retrieve.return_value = MagicMock(
+        status="completed", output_file_id="out-1", request_counts=MagicMock(total=1)
+    )
+    client.files.content.return_value = MagicMock(text=_line("0", "hello"))
+
+    assert await TextAgent().poll_batch("batch-1") == ["hello"]
+
+
+async def test_poll_batch_without_output_file(client):
+    client.batches.retrieve.return_value = MagicMock(
+        status="completed", output_file_id=None, request_counts=MagicMock(total=2)
+    )
+    assert await SummaryJudgeAgent().poll_batch("batch-1") == [None, None]
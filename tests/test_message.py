@@ -68,8 +68,7 @@ class TestContentToMessages:
         # Mock the output BytesIO to return PDF bytes
         with patch("io.BytesIO") as mock_bytesio:
             mock_output = MagicMock()
-            mock_output.read.return_value = b"%PDF-1.4 fake pdf data"
-            mock_output.seek = MagicMock()
+            mock_output.getvalue.return_value = b"%PDF-1.4 fake pdf data"
             mock_bytesio.return_value = mock_output
 
             content = Content(
@@ -100,8 +99,7 @@ class TestContentToMessages:
 
         with patch("io.BytesIO") as mock_bytesio:
             mock_output = MagicMock()
-            mock_output.read.return_value = b"This is text content"
-            mock_output.seek = MagicMock()
+            mock_output.getvalue.return_value = b"This is text content"
             mock_bytesio.return_value = mock_output
 
             content = Content(mode="url", content="s3://bucket/path/test.txt", mime="text/plain", title="")
@@ -131,8 +129,7 @@ class TestContentToMessages:
 
         with patch("io.BytesIO") as mock_bytesio:
             mock_output = MagicMock()
-            mock_output.read.return_value = b"%PDF-1.4 fake pdf"
-            mock_output.seek = MagicMock()
+            mock_output.getvalue.return_value = b"%PDF-1.4 fake pdf"
             mock_bytesio.return_value = mock_output
 
             content = Content(mode="url", content="https://example.com/doc.pdf", mime="application/pdf")
@@ -163,8 +160,7 @@ class TestContentToMessages:
 
         with patch("io.BytesIO") as mock_bytesio:
             mock_output = MagicMock()
-            mock_output.read.return_value = b"fake docx binary data"
-            mock_output.seek = MagicMock()
+            mock_output.getvalue.return_value = b"fake docx binary data"
             mock_bytesio.return_value = mock_output
 
             content = Content(
@@ -0,0 +1,85 @@
+import io
+
+from docx import Document
+
+from antgent.utils.reporting import markdown_to_docx_bytes
+
+MARKDOWN = """# Title
+
+Some **bold** and *italic* text with `code`
+on two lines.
+
+- first [link](http://x.com)
+- second
+  - nested **item**
+
+1. one
+2. two
+
+> quoted
+
+```
+x = 1
+```
+
+Inline <b>html</b> and Text<br>after
+
+<div>raw <i>block</i></div>
+"""
+
+
+def _render(markdown: str, **kwargs) -> list:
+    return Document(io.BytesIO(markdown_to_docx_bytes(markdown, **kwargs))).paragraphs
+
+
+def _runs(paragraph) -> list[tuple[str, bool | None, bool | None]]:
+    return [(run.text, run.bold, run.italic) for run in paragraph.runs if run.text]
+
+
+def test_markdown_to_docx_paragraphs_and_styles():
+    paragraphs = _render(MARKDOWN)
+
+    assert [(p.style.name, p.text) for p in paragraphs] == [
+        ("Heading 1", "Content"),
+        ("Heading 1", "Title"),
+        ("Normal", "Some bold and italic text with code on two lines."),
+        ("List Bullet", "first link"),
+        ("List Bullet", "second"),
+        ("List Bullet 2", "nested item"),
+        ("List Number", "one"),
+        ("List Number", "two"),
+        ("Quote", "quoted"),
+        ("Normal", "x = 1"),
+        ("Normal", "Inline html and Text\nafter"),
+        ("Normal", "raw block"),
+    ]
+    assert _runs(paragraphs[2])[:4] == [
+        ("Some ", None, None),
+        ("bold", True, None),
+        (" and ", None, None),
+        ("italic", None, True),
+    ]
+    assert _runs(paragraphs[5]) == [("nested ", None, None), ("item", True, None)]
+    # Inline and block HTML is interpreted, not copied verbatim
+    assert ("html", True, None) in _runs(paragraphs[10])
+    assert ("block", None, True) in _runs(paragraphs[11])
+
+
+def test_markdown_to_docx_hyperlinks():
+    paragraphs = _render("See [the site](http://x.com) and **[bold](https://y.org)**.")
+
+    links = paragraphs[1].hyperlinks
+    assert [(link.address, link.text) for link in links] == [("http://x.com", "the site"), ("https://y.org", "bold")]
+    assert links[1].runs[0].bold is True
+    assert paragraphs[1].text == "See the site and bold."
+
+
+def test_markdown_to_docx_metadata_page():
+    paragraphs = _render("text", metadata_sections={"Summary": "short"}, metadata_title="Details")
+
+    assert [(p.style.name, p.text) for p in paragraphs[:3]] == [
+        ("Heading 1", "Details"),
+        ("Heading 2", "Summary"),
+        ("Normal", "short"),
+    ]
+    assert paragraphs[-1].text == "text"
@@ -0,0 +1,192 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agents.stream_events import RawResponsesStreamEvent
+from openai.types.responses import ResponseTextDeltaEvent
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from antgent.agents import runner
+from antgent.agents.base import BaseAgent
+from antgent.agents.runner import ContextTooLargeError
+from antgent.models.agent import AgentConfig, AgentFrozenConfig, PrepareRun
+
+
+class WrappingAgent(BaseAgent[None, str]):
+    """Puts the content into a message list behind a fixed instruction, like the summarizer agents."""
+
+    name_id = "Wrapping"
+    default_config = AgentConfig(name="Wrapping", model="gpt-4o", client="openai")
+    agent_config = AgentFrozenConfig[str, str](output_cls=str, structured=False)
+
+    def prompt(self) -> str:
+        return "prompt"
+
+    async def prep_input(self, llm_input, ctx) -> PrepareRun[None]:
+        _ = llm_input
+        messages = [
+            {"role": "user", "content": "instruction words"},
+            {"role": "user", "content": ctx["content"]},
+        ]
+        return PrepareRun(llm_input=messages, context=ctx, short_cut=False)
+
+
+class PlainAgent(WrappingAgent):
+    """Sends the string input as is."""
+
+    async def prep_input(self, llm_input, ctx) -> PrepareRun[None]:
+        return PrepareRun(llm_input=llm_input, context=ctx, short_cut=False)
+
+
+def _words(_agent, content) -> int:
+    if isinstance(content, str):
+        return len(content.split())
+    return sum(len(m["content"].split()) for m in content)
+
+
+@pytest.fixture
+def word_count_tokens(word_tokens):
+    """Counts one token per word too: token counts match the word_tokens encoder."""
+    with patch.object(WrappingAgent, "count_tokens", _words):
+        yield
+
+
+@pytest.fixture
+def runner_run():
+    with patch("antgent.agents.runner.Runner.run", new_callable=AsyncMock) as run:
+        run.return_value = MagicMock(final_output="summary")
+        yield run
+
+
+def _agent(max_tokens: int, cls: type[WrappingAgent] = WrappingAgent) -> WrappingAgent:
+    agent = cls()
+    agent._max_tokens = max_tokens
+    return agent
+
+
+async def test_run_truncated_cuts_the_prepared_content(word_count_tokens, runner_run):
+    agent = _agent(10)
+    context = {"content": " ".join(f"w{i}" for i in range(20))}
+
+    res = await agent.run_truncated(MagicMock(), "", context)
+
+    assert res == "summary"
+    messages = runner_run.await_args.kwargs["input"]
+    assert messages[0]["content"] == "instruction words"
+    assert messages[1]["content"] == " ".join(f"w{i}" for i in range(8))
+    # the prepared context is untouched
+    assert len(context["content"].split()) == 20
+
+
+async def test_run_truncated_string_input(word_count_tokens, runner_run):
+    agent = _agent(3, PlainAgent)
+    await agent.run_truncated(MagicMock(), "a b c d e", {})
+
+    assert runner_run.await_args.kwargs["input"] == "a b c"
+
+
+async def test_run_truncated_fitting_input_is_unchanged(word_count_tokens, runner_run):
+    agent = _agent(10)
+    await agent.run_truncated(MagicMock(), "", {"content": "short text"})
+
+    assert runner_run.await_args.kwargs["input"][1]["content"] == "short text"
+
+
+async def test_run_truncated_rechecks_before_running(word_count_tokens, runner_run):
+    # the instruction alone exceeds the window: nothing to cut from the content makes it fit
+    agent = _agent(1)
+    with pytest.raises(ContextTooLargeError):
+        await agent.run_truncated(MagicMock(), "", {"content": "a b"})
+    runner_run.assert_not_awaited()
+
+
+async def test_run_truncated_recheck_after_cut(word_count_tokens, runner_run):
+    # re-tokenization at the cut yields more tokens than asked for: the retry is not sent
+    agent = _agent(4)
+    overlong = patch(
+        "antgent.agents.runner.truncate_tokens", side_effect=lambda _m, text, n: " ".join(text.split()[: n + 1])
+    )
+    with overlong, pytest.raises(ContextTooLargeError):
+        await agent.run_truncated(MagicMock(), "", {"content": "a b c d e"})
+    runner_run.assert_not_awaited()
+
+
+class Story(BaseModel):
+    title: str
+    body: str
+
+
+class StoryAgent(PlainAgent):
+    agent_config = AgentFrozenConfig[Story, Story](output_cls=Story, structured=True)
+
+
+class FakeStreamedResult:
+    """Streams the text one character per delta, then exposes final_output."""
+
+    def __init__(self, text: str, final_output) -> None:
+        self.text = text
+        self.final_output = final_output
+
+    async def stream_events(self):
+        yield MagicMock(type="agent_updated_stream_event")
+        for char in self.text:
+            delta = ResponseTextDeltaEvent.model_construct(delta=char, type="response.output_text.delta")
+            yield RawResponsesStreamEvent(data=delta)
+
+
+STORY = Story(title="A title", body="x" * 2000)
+
+
+async def _stream(agent, text: str, final_output) -> tuple[list, MagicMock]:
+    streamed = FakeStreamedResult(text, final_output)
+    with (
+        patch("antgent.agents.runner.Runner.run_streamed", return_value=streamed),
+        patch.object(agent, "agent"),
+        patch("antgent.agents.runner.from_json", wraps=from_json) as parse,
+    ):
+        outputs = [output async for output in agent.stream("", None)]
+    return outputs, parse
+
+
+async def test_stream_partial_outputs():
+    text = STORY.model_dump_json()
+    outputs, parse = await _stream(StoryAgent(), text, STORY)
+
+    assert outputs[-1] is STORY
+    partials = outputs[:-1]
+    assert partials
+    assert all(isinstance(p, Story) for p in partials)
+    # partials only grow: trailing strings are decoded as far as they came
+    bodies = [getattr(p, "body", "") for p in partials]
+    assert bodies == sorted(bodies, key=len)
+    assert all(STORY.body.startswith(b) for b in bodies)
+    # one delta per char, but the buffer is only re-parsed on geometric growth
+    assert parse.call_count < 30
+    assert len(parse.call_args_list[-1].args[0]) <= len(text)
+    assert sum(len(call.args[0]) for call in parse.call_args_list) < runner.STREAM_PARSE_GROWTH * 2 * len(text)
+
+
+async def test_stream_plain_text():
+    outputs, parse = await _stream(PlainAgent(), "some text", "some text")
+
+    assert outputs == ["some text"]
+    parse.assert_not_called()
+
+
+async def test_run_truncated_tokenizes_only_the_cut_text(word_count_tokens, runner_run):
+    class ManyMessagesAgent(WrappingAgent):
+        async def prep_input(self, llm_input, ctx) -> PrepareRun[None]:
+            messages = [{"role": "user", "content": f"m{i} m{i}"} for i in range(12)]
+            messages.insert(5, {"role": "user", "content": ctx["content"]})
+            return PrepareRun(llm_input=messages, context=ctx, short_cut=False)
+
+    agent = _agent(30, ManyMessagesAgent)
+    content = " ".join(f"w{i}" for i in range(20))
+
+    with patch("antgent.agents.runner.encode_text", wraps=runner.encode_text) as encode:
+        await agent.run_truncated(MagicMock(), "", {"content": content})
+
+    encode.assert_called_once_with(agent.model, content)
+    messages = runner_run.await_args.kwargs["input"]
+    assert messages[5]["content"] == " ".join(f"w{i}" for i in range(6))
+    assert [m["content"] for m in messages[:5]] == [f"m{i} m{i}" for i in range(5)]
@@ -0,0 +1,190 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from antgent.agents.base import BaseAgent
+from antgent.agents.summarizer import logic
+from antgent.agents.summarizer.cache import SummaryCache
+from antgent.agents.summarizer.models import (
+    Entity,
+    SummaryGrade,
+    SummaryInput,
+    SummaryOutput,
+    SummaryWithGrade,
+)
+from antgent.agents.summarizer.summary import SummaryAgent
+from antgent.agents.summarizer.summary_graded import SummaryGradedAgent
+
+
+def _summary(n: int) -> SummaryOutput:
+    return SummaryOutput(short_version=f"short {n}", description="desc", title=f"title {n}", language="en")
+
+
+def _grade(grade: int, missing: int = 0) -> SummaryGrade:
+    return SummaryGrade(
+        grade=grade,
+        feedbacks=[f"feedback {grade}"],
+        grade_reasoning="reasoning",
+        missing_entities=[Entity(name=f"e{i}", type="name") for i in range(missing)],
+    )
+
+
+def _graded(n: int, grade: SummaryGrade) -> SummaryWithGrade:
+    return SummaryWithGrade.model_validate(_summary(n).model_dump() | grade.model_dump())
+
+
+def _agent(outputs: list) -> MagicMock:
+    agent = MagicMock(name_id="Stub")
+    agent.workflow = AsyncMock(side_effect=outputs)
+    return agent
+
+
+async def _run(ctx: SummaryInput, summarizer: MagicMock, judge: MagicMock):
+    with patch.object(logic, "_select_agents", return_value=(summarizer, judge)) as select:
+        result = await logic.summarize_one_type(ctx, {})
+    return result, select
+
+
+async def test_combined_grading_splits_and_exits_early():
+    grades = [_grade(5, missing=1), _grade(9), _grade(10)]
+    summarizer = _agent([_graded(i, g) for i, g in enumerate(grades)])
+    judge = _agent([])
+
+    result, select = await _run(SummaryInput(content="text", iterations=3, combined_grading=True), summarizer, judge)
+
+    assert select.call_args.args[2] is True
+    # good enough on the second iteration: the third is never requested
+    assert summarizer.workflow.await_count == 2
+    judge.workflow.assert_not_awaited()
+    # the combined output is split back into a plain summary and its grade
+    assert [type(s) for s in result.summaries] == [SummaryOutput, SummaryOutput]
+    assert result.summaries == [_summary(0), _summary(1)]
+    assert result.grades == grades[:2]
+    assert result.summary == _summary(1)
+    # the next iteration gets the feedbacks of the previous grade
+    assert summarizer.workflow.await_args_list[1].kwargs["context"].feedbacks == ["feedback 5"]
+
+
+@pytest.mark.parametrize(
+    "grades",
+    [
+        [_grade(6, missing=1), _grade(4), _grade(5)],
+        [_grade(5), _grade(6, missing=2), _grade(6, missing=1)],
+        [_grade(3), _grade(9)],
+    ],
+)
+async def test_combined_grading_matches_two_agent_path(grades):
+    ctx = SummaryInput(content="text", iterations=len(grades))
+    combined, _ = await _run(
+        ctx.model_copy(update={"combined_grading": True}), _agent([_graded(i, g) for i, g in enumerate(grades)]), None
+    )
+    separate, _ = await _run(ctx, _agent([_summary(i) for i in range(len(grades))]), _agent(grades))
+
+    assert combined == separate
+
+
+async def test_combined_grading_needs_iterations():
+    summarizer = _agent([_summary(0)])
+    judge = _agent([])
+
+    result, select = await _run(SummaryInput(content="text", combined_grading=True), summarizer, judge)
+
+    assert select.call_args.args[2] is False
+    assert result.summary == _summary(0)
+    assert result.grades == []
+    judge.workflow.assert_not_awaited()
+
+
+def test_graded_prompt_lists_fields():
+    prompt = SummaryGradedAgent().prompt()
+    assert "Field(" not in prompt
+    for field in ("grade", "feedbacks", "grade_reasoning", "missing_entities"):
+        assert f"\n- {field}: " in prompt
+
+
+class SlowSummarizer:
+    """Returns the given summaries, the calls past them hang until cancelled."""
+
+    name_id = "Slow"
+
+    def __init__(self, summaries: list[SummaryOutput]) -> None:
+        self.summaries = list(summaries)
+        self.contexts: list[SummaryInput] = []
+        self.use_cache: list[bool] = []
+        self.cancelled = 0
+
+    async def workflow(self, llm_input, context, *, use_cache=True):
+        _ = llm_input
+        self.contexts.append(context)
+        self.use_cache.append(use_cache)
+        if self.summaries:
+            return self.summaries.pop(0)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+@pytest.mark.parametrize("judged", [_grade(9), None], ids=["accepted", "judge-failed"])
+async def test_speculative_cancelled_and_awaited(judged):
+    summarizer = SlowSummarizer([_summary(0)])
+
+    async def judge_later(**_):
+        await asyncio.sleep(0)  # lets the speculative generation start
+        return judged
+
+    judge = MagicMock(workflow=AsyncMock(side_effect=judge_later))
+
+    result, _ = await _run(SummaryInput(content="text", iterations=3, speculative=True), summarizer, judge)
+
+    assert result.summaries == [_summary(0)]
+    # the speculative generation was started, then cancelled and awaited before returning
+    assert len(summarizer.contexts) == 2
+    assert summarizer.cancelled == 1
+
+
+async def test_speculative_feedback_lag():
+    summarizer = SlowSummarizer([_summary(0), _summary(1), _summary(2)])
+    grades = [_grade(1), _grade(2), _grade(3)]
+
+    result, _ = await _run(SummaryInput(content="text", iterations=3, speculative=True), summarizer, _agent(grades))
+
+    assert result.summaries == [_summary(0), _summary(1), _summary(2)]
+    assert result.grades == grades
+    assert result.summary == _summary(2)
+    # each summary is started before the previous grade: it sees the feedbacks one iteration late
+    assert [c.feedbacks for c in summarizer.contexts] == [[], [], ["feedback 1"]]
+    # the speculative generations skip the cache reads
+    assert summarizer.use_cache == [True, False, False]
+    assert summarizer.cancelled == 0
+
+
+@pytest.fixture
+def summary_cache():
+    SummaryAgent.set_cache(SummaryCache())
+    yield
+    SummaryAgent.set_cache(None)
+
+
+@pytest.mark.usefixtures("summary_cache")
+async def test_speculative_with_cache():
+    # the speculative generation has the ctx, and so the cache key, of the summary being judged:
+    # it must not get that summary back from the cache
+    generated = [_summary(i) for i in range(3)]
+    judge = _agent([_grade(1), _grade(2), _grade(3)])
+
+    with patch.object(BaseAgent, "workflow", new_callable=AsyncMock, side_effect=generated) as llm:
+        result, _ = await _run(SummaryInput(content="text", iterations=3, speculative=True), SummaryAgent(), judge)
+
+    assert result.summaries == generated
+    assert llm.await_count == 3
+    # the judge graded three different summaries
+    assert [call.kwargs["context"].short_version for call in judge.workflow.await_args_list] == [
+        "short 0",
+        "short 1",
+        "short 2",
+    ]
+    # the fresh runs are still stored
+    assert len(SummaryAgent.cache._data) == 2
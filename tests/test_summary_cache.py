@@ -0,0 +1,210 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from antgent.agents.base import BaseAgent
+from antgent.agents.summarizer.cache import SemanticSummaryCache, SummaryCache
+from antgent.agents.summarizer.models import SummaryInput, SummaryOutput, SummaryType
+from antgent.agents.summarizer.summary import SummaryAgent
+from antgent.config import SemanticSummaryCacheConfigSchema, SummaryCacheConfigSchema
+from antgent.init import init_summary_cache
+from antgent.utils import token
+
+SUMMARY = SummaryOutput(short_version="short", description="desc", title="title", language="en")
+
+
+def test_key_is_stable():
+    ctx = SummaryInput(content="text", feedbacks=["a"], to_language="en")
+    key = SummaryCache.key("Agent", "model", ctx)
+    assert key == SummaryCache.key("Agent", "model", ctx.model_copy())
+    assert key == SummaryCache.key("Agent", "model", SummaryInput(content="text", feedbacks=["a"], to_language="en"))
+
+
+@pytest.mark.parametrize(
+    ("agent", "model", "update"),
+    [
+        ("Other", "model", {}),
+        ("Agent", "other", {}),
+        ("Agent", "model", {"content": "other"}),
+        ("Agent", "model", {"to_language": "de"}),
+        ("Agent", "model", {"summary_type": SummaryType.PRETTY}),
+        ("Agent", "model", {"feedbacks": ["b"]}),
+        # feedbacks and content are delimited: moving text across the boundary changes the key
+        ("Agent", "model", {"feedbacks": ["at"], "content": "ext"}),
+    ],
+)
+def test_key_covers_inputs(agent, model, update):
+    ctx = SummaryInput(content="text", feedbacks=["a"], to_language="en")
+    assert SummaryCache.key(agent, model, ctx.model_copy(update=update)) != SummaryCache.key("Agent", "model", ctx)
+
+
+def test_get_set_and_miss():
+    cache = SummaryCache()
+    assert cache.get("k") is None
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+
+
+def test_ttl_expiry():
+    cache = SummaryCache(ttl=10)
+    with patch("antgent.agents.summarizer.cache.time.monotonic", return_value=100.0):
+        cache.set("k", "v")
+    with patch("antgent.agents.summarizer.cache.time.monotonic", return_value=110.0):
+        assert cache.get("k") == "v"
+    with patch("antgent.agents.summarizer.cache.time.monotonic", return_value=110.1):
+        assert cache.get("k") is None
+    assert "k" not in cache._data
+
+
+def test_lru_eviction():
+    cache = SummaryCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "b" is now the least recently used
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_invalidate():
+    cache = SummaryCache()
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == "2"
+    cache.invalidate()
+    assert cache.get("b") is None
+
+
+@pytest.fixture
+def summary_cache():
+    cache = SummaryCache()
+    SummaryAgent.set_cache(cache)
+    yield cache
+    SummaryAgent.set_cache(None)
+
+
+@pytest.fixture
+def base_workflow():
+    with patch.object(BaseAgent, "workflow", new_callable=AsyncMock, return_value=SUMMARY) as workflow:
+        yield workflow
+
+
+async def test_cached_workflow_hit(summary_cache, base_workflow):
+    agent = SummaryAgent()
+    ctx = SummaryInput(content="text")
+
+    first = await agent.workflow("", ctx)
+    second = await agent.workflow("", ctx.model_copy())
+
+    assert first == second == SUMMARY
+    # the hit is a fresh copy, not the object returned by the run
+    assert second is not first
+    base_workflow.assert_awaited_once()
+    assert summary_cache.get(SummaryCache.key(agent.name_id, agent.model, ctx)) == SUMMARY.model_dump_json()
+
+    await agent.workflow("", ctx.model_copy(update={"feedbacks": ["shorter"]}))
+    assert base_workflow.await_count == 2
+
+
+async def test_cached_workflow_skips_cache(summary_cache, base_workflow):
+    agent = SummaryAgent()
+    # an explicit llm_input bypasses the cache
+    await agent.workflow("raw", SummaryInput(content="text"))
+    await agent.workflow("raw", SummaryInput(content="text"))
+    assert base_workflow.await_count == 2
+    assert not summary_cache._data
+
+    # failed runs are not cached
+    base_workflow.return_value = None
+    assert await agent.workflow("", SummaryInput(content="other")) is None
+    assert not summary_cache._data
+
+
+@pytest.fixture
+def embeddings():
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(return_value=MagicMock(data=[MagicMock(embedding=[3.0, 4.0])]))
+    with patch("antgent.agents.summarizer.cache.openai_aclient", return_value=client):
+        yield client.embeddings.create
+
+
+@pytest.fixture
+def cache_encode_text(word_tokens):
+    """Spy on the cache's tokenization, one token per word (conftest word_tokens)."""
+    with patch("antgent.agents.summarizer.cache.encode_text", wraps=token.encode_text) as encode:
+        yield encode
+
+
+async def test_embed_normalizes(embeddings, cache_encode_text):
+    cache = SemanticSummaryCache(embedding_model="emb", max_input_tokens=100)
+
+    assert await cache.embed("some text") == pytest.approx((0.6, 0.8))
+    embeddings.assert_awaited_once_with(model="emb", input="some text")
+    # fewer bytes than the limit: not tokenized
+    cache_encode_text.assert_not_called()
+
+
+async def test_embed_skips_content_over_limit(embeddings, cache_encode_text):
+    cache = SemanticSummaryCache(max_input_tokens=3)
+
+    # over the limit in bytes but not in tokens: embedded
+    assert await cache.embed("long-word another-word") is not None
+    # over the limit in tokens: not embedded, no call
+    embeddings.reset_mock()
+    assert await cache.embed("a b c d") is None
+    embeddings.assert_not_awaited()
+    assert cache_encode_text.call_count == 2
+
+
+async def test_embed_failure(embeddings):
+    embeddings.side_effect = RuntimeError("down")
+    assert await SemanticSummaryCache().embed("text") is None
+
+
+def test_semantic_get_scope_and_threshold():
+    cache = SemanticSummaryCache(threshold=0.9, maxsize=2)
+    cache.set("scope", (1.0, 0.0), "x")
+    cache.set("scope", (0.6, 0.8), "y")
+
+    assert cache.get("scope", (0.95, 0.3122)) == "x"
+    assert cache.get("scope", (0.0, 1.0)) is None
+    assert cache.get("other", (1.0, 0.0)) is None
+
+    cache.set("scope", (0.0, 1.0), "z")  # evicts "y", "x" was used last
+    assert cache.get("scope", (0.6, 0.8)) is None
+    assert cache.get("scope", (0.0, 1.0)) == "z"
+
+
+async def test_cached_workflow_semantic_hit(base_workflow):
+    cache = SemanticSummaryCache()
+    SummaryAgent.set_semantic_cache(cache)
+    try:
+        agent = SummaryAgent()
+        with patch.object(cache, "embed", new_callable=AsyncMock, side_effect=[(1.0, 0.0), (0.99, 0.141), None]):
+            assert await agent.workflow("", SummaryInput(content="text")) == SUMMARY
+            assert await agent.workflow("", SummaryInput(content="text!")) == SUMMARY
+            base_workflow.assert_awaited_once()
+            # not embedded (too long or failed): runs and isn't cached
+            assert await agent.workflow("", SummaryInput(content="long")) == SUMMARY
+        assert base_workflow.await_count == 2
+        assert len(cache._data) == 1
+    finally:
+        SummaryAgent.set_semantic_cache(None)
+
+
+def test_init_summary_cache_toggle():
+    semantic = SemanticSummaryCacheConfigSchema(enabled=True, threshold=0.9, max_input_tokens=100)
+    init_summary_cache(SummaryCacheConfigSchema(enabled=True, maxsize=3, ttl=5, semantic=semantic))
+    try:
+        assert isinstance(SummaryAgent.cache, SummaryCache)
+        assert (SummaryAgent.cache.maxsize, SummaryAgent.cache.ttl) == (3, 5)
+        assert isinstance(SummaryAgent.semantic_cache, SemanticSummaryCache)
+        assert (SummaryAgent.semantic_cache.threshold, SummaryAgent.semantic_cache.max_input_tokens) == (0.9, 100)
+    finally:
+        init_summary_cache(SummaryCacheConfigSchema())
+    assert SummaryAgent.cache is None
+    assert SummaryAgent.semantic_cache is None
@@ -0,0 +1,97 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from antgent.agents.summarizer import summary
+from antgent.agents.summarizer.models import SummaryInput, SummaryOutput
+from antgent.agents.summarizer.summary import SummaryAgent
+from antgent.models.agent import AgentConfig
+
+pytestmark = pytest.mark.usefixtures("word_tokens")
+
+
+def _words(prefix: str, size: int) -> str:
+    return " ".join([prefix] * size)
+
+
+def _shrinking(_llm_input, context: SummaryInput, _use_cache: bool = True) -> SummaryOutput:
+    """Summary of a chunk: its first word."""
+    return SummaryOutput(short_version=context.content.split()[0], description="d", title="t", language="en")
+
+
+def _agent(chunk_tokens: int | None, side_effect=_shrinking) -> tuple[SummaryAgent, AsyncMock]:
+    conf = AgentConfig() if chunk_tokens is None else AgentConfig(chunk_tokens=chunk_tokens)
+    agent = SummaryAgent(conf=conf)
+    cached = AsyncMock(side_effect=side_effect)
+    agent._cached_workflow = cached
+    return agent, cached
+
+
+def _contents(cached: AsyncMock) -> list[str]:
+    return [call.args[1].content for call in cached.await_args_list]
+
+
+@pytest.mark.parametrize(
+    ("chunk_tokens", "llm_input"),
+    [(None, ""), (100, ""), (2, "explicit input")],
+    ids=["disabled", "fits", "llm-input"],
+)
+async def test_no_chunking(chunk_tokens, llm_input):
+    agent, cached = _agent(chunk_tokens)
+    content = f"{_words('a', 5)}\n\n{_words('b', 5)}"
+
+    await agent.workflow(llm_input, SummaryInput(content=content))
+
+    assert _contents(cached) == [content]
+
+
+async def test_map_reduce_with_overlap():
+    agent, cached = _agent(8)
+    content = "\n\n".join(_words(p, 4) for p in ("a", "b", "c"))
+
+    with patch.object(summary, "CHUNK_OVERLAP_TOKENS", 4):
+        result = await agent.workflow("", SummaryInput(content=content, feedbacks=["f"]))
+
+    # chunks share their boundary paragraph, then the short versions are summarized again
+    assert _contents(cached) == [
+        f"{_words('a', 4)}\n\n{_words('b', 4)}",
+        f"{_words('b', 4)}\n\n{_words('c', 4)}",
+        "a\n\nb",
+    ]
+    assert result.short_version == "a"
+    # the rest of the context is kept on every call
+    assert all(call.args[1].feedbacks == ["f"] for call in cached.await_args_list)
+
+
+async def test_oversized_paragraph_is_not_split():
+    agent, cached = _agent(4)
+    content = _words("a", 10)
+
+    await agent.workflow("", SummaryInput(content=content))
+
+    assert _contents(cached) == [content]
+
+
+def _identity(_llm_input, context: SummaryInput, _use_cache: bool = True) -> SummaryOutput:
+    """Summary that doesn't shrink its chunk."""
+    return SummaryOutput(short_version=context.content, description="d", title="t", language="en")
+
+
+async def test_depth_cap():
+    # the summaries never shrink: the reduce step stops after MAX_CHUNK_DEPTH levels
+    agent, cached = _agent(4, side_effect=_identity)
+    content = "\n\n".join(_words(p, 3) for p in ("a", "b", "c"))
+
+    await agent.workflow("", SummaryInput(content=content))
+
+    # 3 chunks per level, then the last level gets the content over chunk_tokens as is
+    assert cached.await_count == 3 * summary.MAX_CHUNK_DEPTH + 1
+    assert _contents(cached)[-1] == content
+
+
+async def test_failed_chunks_are_dropped():
+    outputs = iter([None, None])
+    agent, cached = _agent(4, side_effect=lambda *_: next(outputs))
+
+    assert await agent.workflow("", SummaryInput(content=f"{_words('a', 3)}\n\n{_words('b', 3)}")) is None
+    assert cached.await_count == 2
@@ -0,0 +1,62 @@
+import io
+
+import openpyxl
+import pytest
+from docx import Document
+
+from antgent.utils.excel import list_dict_to_xlsx_bytes
+from antgent.utils.reporting import markdown_to_docx_bytes
+from antgent.utils.tables import row_values
+
+
+@pytest.mark.parametrize(
+    ("rows", "headers", "expected"),
+    [
+        ([{}, {"a": 1}], (), [(), ()]),
+        ([{"a": 1}, {"a": 2}], ("a",), [(1,), (2,)]),
+        ([{"a": 1, "b": 2, "c": 3}], ("a", "b", "c"), [(1, 2, 3)]),
+        ([{"b": 2, "a": 1}], ("a", "b"), [(1, 2)]),
+    ],
+)
+def test_row_values(rows, headers, expected):
+    assert list(row_values(rows, headers)) == expected
+
+
+def test_row_values_missing_keys():
+    rows = [{"a": 1, "b": 2}, {"a": 3}, {}]
+    assert list(row_values(rows, ("a", "b"))) == [(1, 2), (3, None), (None, None)]
+    assert list(row_values(rows, ("a",), default="")) == [(1,), (3,), ("",)]
+
+
+def _xlsx_rows(data: bytes) -> list[tuple]:
+    sheet = openpyxl.load_workbook(io.BytesIO(data)).active
+    return list(sheet.iter_rows(values_only=True))
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ([{}], []),
+        ([{"a": 1}, {"a": 2}], [("a",), (1,), (2,)]),
+        ([{"a": 1, "b": "x"}, {"a": 2}], [("a", "b"), (1, "x"), (2, None)]),
+    ],
+)
+def test_list_dict_to_xlsx_bytes(data, expected):
+    assert _xlsx_rows(list_dict_to_xlsx_bytes(data)) == expected
+
+
+def _docx_table(data: list[dict]) -> list[list[str]]:
+    document = Document(io.BytesIO(markdown_to_docx_bytes("text", tables={"Table": data})))
+    return [[cell.text for cell in row.cells] for row in document.tables[0].rows]
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ([{}], [[], []]),
+        ([{"a": 1}], [["a"], ["1"]]),
+        ([{"a": 1, "b": "x"}, {"a": 2}, {"b": "y"}], [["a", "b"], ["1", "x"], ["2", ""], ["", "y"]]),
+    ],
+)
+def test_docx_table(data, expected):
+    assert _docx_table(data) == expected
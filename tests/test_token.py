@@ -0,0 +1,59 @@
+import pytest
+
+from antgent.utils.token import split_by_tokens, truncate_tokens
+
+
+def _text(*sizes: int) -> str:
+    """Paragraphs p<n> of the given number of words."""
+    return "\n\n".join(" ".join([f"p{n}"] * size) for n, size in enumerate(sizes))
+
+
+def _paragraphs(chunk: str) -> list[str]:
+    return [p.split()[0] for p in chunk.split("\n\n")]
+
+
+@pytest.mark.usefixtures("word_tokens")
+def test_split_packs_paragraphs():
+    chunks = split_by_tokens("m", _text(3, 3, 3, 5, 1), max_tokens=6)
+    assert [_paragraphs(c) for c in chunks] == [["p0", "p1"], ["p2"], ["p3", "p4"]]
+    assert split_by_tokens("m", _text(3, 3), max_tokens=6) == [_text(3, 3)]
+
+
+@pytest.mark.usefixtures("word_tokens")
+def test_split_drops_blank_paragraphs():
+    assert split_by_tokens("m", "a b\n\n  \n\n\n\nc", max_tokens=10) == ["a b\n\nc"]
+    assert split_by_tokens("m", "", max_tokens=10) == []
+
+
+@pytest.mark.usefixtures("word_tokens")
+def test_split_keeps_oversized_paragraph_whole():
+    chunks = split_by_tokens("m", _text(2, 10, 2), max_tokens=4, overlap=2)
+    assert [_paragraphs(c) for c in chunks] == [["p0"], ["p1"], ["p2"]]
+    assert len(chunks[1].split()) == 10
+
+
+@pytest.mark.usefixtures("word_tokens")
+def test_split_overlap():
+    # the tail of the previous chunk is carried over, up to `overlap` tokens
+    chunks = split_by_tokens("m", _text(2, 2, 2, 2, 2), max_tokens=6, overlap=2)
+    assert [_paragraphs(c) for c in chunks] == [["p0", "p1", "p2"], ["p2", "p3", "p4"]]
+
+    chunks = split_by_tokens("m", _text(2, 2, 2, 2, 2), max_tokens=6, overlap=4)
+    assert [_paragraphs(c) for c in chunks] == [["p0", "p1", "p2"], ["p1", "p2", "p3"], ["p2", "p3", "p4"]]
+
+    # a paragraph larger than the overlap is not carried
+    chunks = split_by_tokens("m", _text(3, 3, 3), max_tokens=6, overlap=2)
+    assert [_paragraphs(c) for c in chunks] == [["p0", "p1"], ["p2"]]
+
+
+@pytest.mark.usefixtures("word_tokens")
+def test_split_overlap_never_exceeds_max_tokens():
+    chunks = split_by_tokens("m", _text(2, 2, 5, 1), max_tokens=6, overlap=4)
+    assert [_paragraphs(c) for c in chunks] == [["p0", "p1"], ["p2", "p3"]]
+    assert all(len(c.split()) <= 6 for c in chunks)
+
+
+@pytest.mark.usefixtures("word_tokens")
+def test_truncate_tokens():
+    assert truncate_tokens("m", "a b c d", 2) == "a b"
+    assert truncate_tokens("m", "a b", 2) == "a b"
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from antgent.agents.base import BaseAgent
+from antgent.models.agent import AgentConfig, AgentFrozenConfig
+
+
+class EchoAgent(BaseAgent[int, int]):
+    """Returns its context after a delay that decreases with it, tracking how many runs are in flight."""
+
+    name_id = "Echo"
+    default_config = AgentConfig(name="Echo", model="gpt-4o", client="openai")
+    agent_config = AgentFrozenConfig[int, int](output_cls=int, structured=False)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def prompt(self) -> str:
+        return "prompt"
+
+    async def workflow(self, llm_input, context: int) -> int:
+        _ = llm_input
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (10 - context % 10))
+            if context < 0:
+                raise ValueError(f"bad context {context}")
+            return context
+        finally:
+            self.in_flight -= 1
+
+
+async def test_workflow_batch_order():
+    agent = EchoAgent()
+    contexts = list(range(20))
+
+    # later contexts finish first, results still follow the contexts order
+    assert await agent.workflow_batch(contexts) == contexts
+    assert await agent.workflow_batch([]) == []
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3, 8])
+async def test_workflow_batch_concurrency_bound(max_concurrency):
+    agent = EchoAgent()
+
+    await agent.workflow_batch(list(range(20)), max_concurrency=max_concurrency)
+
+    assert agent.max_in_flight == max_concurrency
+    assert agent.in_flight == 0
+
+
+async def test_workflow_batch_raises():
+    with pytest.raises(ValueError, match="bad context -1"):
+        await EchoAgent().workflow_batch([1, -1, 2])
+
+
+async def test_workflow_batch_return_exceptions():
+    results = await EchoAgent().workflow_batch([1, -1, 2, -3], return_exceptions=True)
+
+    assert results[0] == 1
+    assert results[2] == 2
+    assert isinstance(results[1], ValueError)
+    assert str(results[3]) == "bad context -3"